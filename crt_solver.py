@@ -2,6 +2,8 @@
 
 https://www.math.cmu.edu/~mradclif/teaching/127S19/Notes/ChineseRemainderTheorem.pdf
 """
+import numpy as np
+
 from modulo_division import inv_mod
 
 def crt_solve(x: list[int], y: list[int]) -> int:
@@ -20,3 +22,34 @@ def crt_solve(x: list[int], y: list[int]) -> int:
         z += m * y[i] * m_inv
         z %= X
     return z
+
+
+def crt_solve_many(x: list[int], ys: list[np.ndarray], m: int) -> np.ndarray:
+    """Solves many systems of congruencies $z \\equiv ys_i mod x_i$ at once.
+
+    `ys[i]` is an array holding the i-th residue of every system. Returns the
+    array of solutions reduced modulo `m`, computed with Garner's algorithm,
+    so that the (possibly huge) solutions are never materialized.
+
+    Assumes that the moduli x_i are pairwise coprime and that all x_i and
+    `m` are smaller than 2^31."""
+    if len(x) != len(ys):
+        raise ValueError("x and ys must be of equal length!")
+    if max(x + [m]) >= 2 ** 31:
+        raise ValueError("moduli must be smaller than 2^31")
+    # z = v_0 + v_1 * x_0 + v_2 * x_0 * x_1 + ..., with 0 <= v_i < x_i.
+    digits = []
+    for i, x_i in enumerate(x):
+        acc = np.zeros(len(ys[i]), dtype=np.int64)
+        prefix = 1
+        for j in range(i):
+            acc = (acc + digits[j] * (prefix % x_i)) % x_i
+            prefix *= x[j]
+        v = (np.asarray(ys[i], dtype=np.int64) - acc) % x_i
+        digits.append(v * inv_mod(prefix % x_i, x_i) % x_i)
+    z = np.zeros(len(ys[0]) if ys else 0, dtype=np.int64)
+    prefix = 1
+    for x_i, v in zip(x, digits):
+        z = (z + v % m * (prefix % m)) % m
+        prefix *= x_i
+    return z
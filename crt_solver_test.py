@@ -1,5 +1,6 @@
 import unittest
-from crt_solver import crt_solve
+import numpy as np
+from crt_solver import crt_solve, crt_solve_many
 
 class CrtSolverTest(unittest.TestCase):
 
@@ -9,5 +10,15 @@ class CrtSolverTest(unittest.TestCase):
             87
         )
 
+    def test_crt_solve_many(self):
+        x = [5, 7, 11]
+        ys = [np.array([2, 0, 4]), np.array([3, 0, 6]), np.array([10, 0, 1])]
+        expected = [crt_solve(x, list(y)) for y in zip(*ys)]
+        np.testing.assert_array_equal(crt_solve_many(x, ys, 1000), expected)
+        np.testing.assert_array_equal(
+            crt_solve_many(x, ys, 10), [e % 10 for e in expected])
+        with self.assertRaises(ValueError):
+            crt_solve_many([5, 7], ys, 10)
+
 if __name__ == '__main__':
     unittest.main()
@@ -7,38 +7,30 @@ def egcd(a: int, b: int) -> tuple[int, int, int]:
     Given two numbers a and b, computes their GCD and solves the equation
     ax + by = gcd(a, b). Returns a tuple (gcd, x, y).
     """
-    r = [a, b]
-    x = [1, 0]
-    y = [0, 1]
+    x0, x1 = 1, 0
+    y0, y1 = 0, 1
     while b != 0:
-        q = a // b
-        r = a % b
-        new_x = x[-2] - x[-1] * q
-        new_y = y[-2] - y[-1] * q
-        x.append(new_x)
-        y.append(new_y)
+        q, r = divmod(a, b)
+        x0, x1 = x1, x0 - x1 * q
+        y0, y1 = y1, y0 - y1 * q
         a, b = b, r
-    return a, x[-2], y[-2]
+    return a, x0, y0
 
 
 def egcd_polynomial(a: P, b: P) -> tuple[P, P, P]:
     """
     Extended Euclidean algorithm for monic polynomials.
     """
-    r = [a, b]
-    x = [P([1]), P([0])]
-    y = [P([0]), P([1])]
+    x0, x1 = P([1]), P([0])
+    y0, y1 = P([0]), P([1])
     while b != 0:
-        q = a // b
-        r = a % b
-        new_x = -q * x[-1] + x[-2]
-        new_y = -q * y[-1] + y[-2]
-        x.append(new_x)
-        y.append(new_y)
+        q, r = divmod(a, b)
+        x0, x1 = x1, -q * x1 + x0
+        y0, y1 = y1, -q * y1 + y0
         a, b = b, r
     u = a.coeffs[-1]
     return (
         a * (1 / u),
-        x[-2] * (1 / u),
-        y[-2] * (1 / u)
+        x0 * (1 / u),
+        y0 * (1 / u)
     )
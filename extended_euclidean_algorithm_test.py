@@ -11,6 +11,14 @@ class TestExtendedEuclideanAlgorithm(unittest.TestCase):
         self.assertEqual(egcd(4, 13), (1, -3, 1))
         self.assertEqual(egcd(28, 14), (14, 0, 1))
         self.assertEqual(egcd(14, 28), (14, 1, 0))
+        self.assertEqual(egcd(5, 0), (5, 1, 0))
+
+    def test_egcd_big(self):
+        a, b = 2 ** 4096 - 159, 3 ** 2000 + 2
+        d, x, y = egcd(a, b)
+        self.assertEqual(a * x + b * y, d)
+        self.assertEqual(a % d, 0)
+        self.assertEqual(b % d, 0)
     
     def test_egcd_polynoial(self):
         self.assertEqual(
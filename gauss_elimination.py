@@ -1,4 +1,9 @@
-from modulo_division import inv_mod
+from collections.abc import Iterable, Iterator
+import heapq
+
+import numpy as np
+
+from modulo_division import inv_mod, inv_mod_batch, mul_mod
 from polynomials_modulo import PolynomialModulo
 
 def print_matrix(m):
@@ -8,8 +13,14 @@ def print_matrix(m):
     print()
     
 
-def gauss_elimination(matrix: list[list[int]]):
-    """Performs the Gauss elimination on the given matrix."""
+def gauss_elimination(matrix: list[list[float]], num_rhs: int = 1):
+    """Performs the Gauss elimination on the given matrix.
+
+    Uses partial pivoting: the pivot of every column is the entry of the
+    largest magnitude at or below the diagonal.
+
+    The last `num_rhs` columns are right-hand sides, all of which are
+    eliminated in the same pass."""
 
     def swap_rows(m, r1, r2):
         """Swaps row `r1` with row `r2`."""
@@ -17,39 +28,217 @@ def gauss_elimination(matrix: list[list[int]]):
     
     def mult_row(m, r, x):
         """Multiplies row `r` by factor of `x`."""
-        m[r] = list(map(lambda e: e * x, m[r]))
+        m[r] = [e * x for e in m[r]]
     
     def add_mult_row(m, r1, r2, x):
         """Adds `r1` multiplied by `x1` to `r2`."""
-        for i in range(len(m[r2])):
-            m[r2][i] += m[r1][i] * x
+        if x != 0:
+            m[r2] = [e2 + e1 * x for e1, e2 in zip(m[r1], m[r2])]
 
     n = len(matrix)
     m = len(matrix[0])
-    # matrix = np.asarray(matrix)
-    # print_matrix(matrix)
-    for i in range(m - 1):
-        if matrix[i][i] == 0:
-            j = i + 1
-            while j < n and matrix[j][i] != 0:
-                j += 1
-            if j < n:
-                swap_rows(matrix, i, j)
+    for i in range(min(n, m - num_rhs)):
+        pivot = max(range(i, n), key=lambda j: abs(matrix[j][i]))
+        swap_rows(matrix, i, pivot)
         if matrix[i][i] != 0:
             mult_row(matrix, i, 1 / matrix[i][i])
             for j in range(i + 1, n):
                 add_mult_row(matrix, i, j, -matrix[j][i])
-        # print_matrix(matrix)
     
-    for i in range(m - 2, -1, -1):
+    for i in range(min(n, m - num_rhs) - 1, -1, -1):
         if matrix[i][i] != 0:
             for j in range(i - 1, -1, -1):
                 add_mult_row(matrix, i, j, -matrix[j][i])
-        # print_matrix(matrix)
 
 
-def gauss_elimination_mod(matrix: list[list[int]], mod: int):
-    """Gaussian elimination modulo `mod`."""
+def _lu_python(a: list[list[float]]) -> tuple[list[list[float]], list[int]]:
+    """LU factorization P A = L U with partial pivoting, in pure Python.
+
+    Returns L and U packed in a single matrix (L has a unit diagonal) and
+    the row permutation."""
+    lu = [list(row) for row in a]
+    n = len(lu)
+    perm = list(range(n))
+    for i in range(n):
+        pivot = max(range(i, n), key=lambda j: abs(lu[j][i]))
+        if lu[pivot][i] == 0:
+            raise ValueError("matrix is singular")
+        lu[i], lu[pivot] = lu[pivot], lu[i]
+        perm[i], perm[pivot] = perm[pivot], perm[i]
+        for j in range(i + 1, n):
+            f = lu[j][i] / lu[i][i]
+            lu[j][i] = f
+            if f != 0:
+                for k in range(i + 1, n):
+                    lu[j][k] -= f * lu[i][k]
+    return lu, perm
+
+
+def _lu_solve_python(lu: list[list[float]], perm: list[int], b: list[float],
+                     transpose: bool = False) -> list[float]:
+    """Solves A x = b (or A^T x = b) given the factors from `_lu_python`."""
+    n = len(lu)
+    if not transpose:
+        x = [b[p] for p in perm]
+        for i in range(n):
+            x[i] -= sum(lu[i][k] * x[k] for k in range(i))
+        for i in range(n - 1, -1, -1):
+            x[i] = (x[i] - sum(
+                lu[i][k] * x[k] for k in range(i + 1, n))) / lu[i][i]
+        return x
+    # A^T = U^T L^T P, so solve with U^T, then L^T and permute back.
+    y = list(b)
+    for i in range(n):
+        y[i] = (y[i] - sum(lu[k][i] * y[k] for k in range(i))) / lu[i][i]
+    for i in range(n - 1, -1, -1):
+        y[i] -= sum(lu[k][i] * y[k] for k in range(i + 1, n))
+    x = [0. for _ in range(n)]
+    for i, p in enumerate(perm):
+        x[p] = y[i]
+    return x
+
+
+def _condition_number_python(a: list[list[float]]) -> float:
+    """Estimates the 1-norm condition number of `a` in pure Python.
+
+    ||A^-1||_1 is estimated with Hager's algorithm, which needs only a few
+    solves with the LU factors of A and A^T."""
+    n = len(a)
+    lu, perm = _lu_python(a)
+    norm = max(sum(abs(a[i][j]) for i in range(n)) for j in range(n))
+    x = [1 / n for _ in range(n)]
+    estimate = 0.
+    for _ in range(5):
+        y = _lu_solve_python(lu, perm, x)
+        new_estimate = sum(abs(e) for e in y)
+        if new_estimate <= estimate:
+            break
+        estimate = new_estimate
+        z = _lu_solve_python(
+            lu, perm, [1. if e >= 0 else -1. for e in y], transpose=True)
+        j = max(range(n), key=lambda i: abs(z[i]))
+        if abs(z[j]) <= sum(z[i] * x[i] for i in range(n)):
+            break
+        x = [float(i == j) for i in range(n)]
+    return norm * estimate
+
+
+def _pick_float_method(a, method: str) -> str:
+    """Resolves the "auto" method for float solvers."""
+    if method == 'auto':
+        # Matrices of e.g. Fractions are solved exactly in Python.
+        return 'python' if np.asarray(a).dtype == object else 'lapack'
+    if method not in ['lapack', 'python']:
+        raise ValueError("unknown solver method")
+    return method
+
+
+def condition_number(a: list[list[float]] | np.ndarray,
+                     method: str = 'auto') -> float:
+    """1-norm condition number of a square matrix `a`.
+
+    Method must be one of "auto", "lapack" or "python". "lapack" computes it
+    exactly with NumPy, "python" estimates it with Hager's algorithm in pure
+    Python. Returns inf for singular matrices.
+
+    Large values (compared to 1 / machine epsilon, about 4.5e15) mean that
+    solutions of systems with this matrix are unreliable."""
+    method = _pick_float_method(a, method)
+    try:
+        if method == 'lapack':
+            return float(np.linalg.cond(np.asarray(a, dtype=np.float64), 1))
+        return _condition_number_python(a)
+    except (np.linalg.LinAlgError, ValueError):
+        return float('inf')
+
+
+def solve(a: list[list[float]] | np.ndarray,
+          b: list[float] | list[list[float]] | np.ndarray,
+          method: str = 'auto',
+          max_condition: float | None = None) -> np.ndarray | list:
+    """Solves a x = b with Gaussian elimination with partial pivoting.
+
+    `b` is either a vector or a matrix with one right-hand side per column.
+
+    Method must be one of "auto", "lapack" or "python". "lapack" runs NumPy's
+    LAPACK-backed solver and returns an ndarray, "python" eliminates in pure
+    Python (see `gauss_elimination`) and returns lists, which also works for
+    exact number types like Fraction. "auto" picks "python" for matrices
+    that NumPy cannot store as floats and "lapack" otherwise.
+
+    Raises ValueError for singular matrices and, if `max_condition` is set,
+    for matrices whose condition number exceeds it."""
+    method = _pick_float_method(a, method)
+    if max_condition is not None and (
+            condition_number(a, method) > max_condition):
+        raise ValueError("the system is ill-conditioned")
+    if method == 'lapack':
+        try:
+            return np.linalg.solve(np.asarray(a, dtype=np.float64),
+                                   np.asarray(b, dtype=np.float64))
+        except np.linalg.LinAlgError:
+            raise ValueError("matrix is singular") from None
+    vector = not isinstance(b[0], (list, tuple, np.ndarray))
+    columns = [[e] for e in b] if vector else [list(r) for r in b]
+    n = len(a)
+    matrix = [list(row) + rhs for row, rhs in zip(a, columns)]
+    gauss_elimination(matrix, num_rhs=len(columns[0]))
+    if any(matrix[i][i] == 0 for i in range(n)):
+        raise ValueError("matrix is singular")
+    solution = [row[n:] for row in matrix]
+    return [row[0] for row in solution] if vector else solution
+
+
+def gauss_elimination_mod_numpy(
+        matrix: list[list[int]] | np.ndarray, mod: int,
+        num_rhs: int = 1) -> np.ndarray:
+    """Gaussian elimination modulo `mod`, with whole-row vector operations.
+
+    Like `gauss_elimination_mod`, reduces the matrix so that the i-th row
+    holds the pivot of the i-th column, but eliminates every column in a
+    single vectorized update of the whole trailing submatrix, which is
+    reduced modulo `mod` only once per pivot.
+
+    Works on int64 arrays for moduli below 2^31 (products of two residues
+    fit in 63 bits) and on arrays of Python ints for bigger moduli.
+
+    The last `num_rhs` columns are right-hand sides, all of which are
+    eliminated in the same pass.
+
+    Returns the reduced matrix and leaves `matrix` unchanged."""
+    dtype = np.int64 if mod < 2 ** 31 else object
+    a = (np.array(matrix, dtype=object) % mod).astype(dtype)
+    n, m = a.shape
+    for i in range(min(n, m - num_rhs)):
+        nonzero = np.flatnonzero(a[i:, i])
+        if not len(nonzero):
+            continue
+        j = i + nonzero[0]
+        if j != i:
+            a[[i, j]] = a[[j, i]]
+        a[i, i:] = a[i, i:] * inv_mod(int(a[i, i]), mod) % mod
+        factors = a[:, i].copy()
+        factors[i] = 0
+        a[:, i:] = (a[:, i:] - factors[:, None] * a[i, i:]) % mod
+    return a
+
+
+def gauss_elimination_mod(
+        matrix: list[list[int]], mod: int, engine: str = 'python',
+        num_rhs: int = 1):
+    """Gaussian elimination modulo `mod`.
+
+    The last `num_rhs` columns are right-hand sides, all of which are
+    eliminated in the same pass.
+
+    Engine must be either "python" or "numpy". The numpy engine runs
+    `gauss_elimination_mod_numpy` and writes the result back to `matrix`."""
+    if engine == 'numpy':
+        matrix[:] = gauss_elimination_mod_numpy(
+            matrix, mod, num_rhs).tolist()
+        return
+    elif engine != 'python':
+        raise ValueError("unknown elimination engine")
 
     def swap_rows(m, r1, r2):
         """Swaps row `r1` with row `r2`."""
@@ -69,10 +258,10 @@ def gauss_elimination_mod(matrix: list[list[int]], mod: int):
     m = len(matrix[0])
     # matrix = np.asarray(matrix)
     # print_matrix(matrix)
-    for i in range(m - 1):
+    for i in range(m - num_rhs):
         if matrix[i][i] == 0:
             j = i + 1
-            while j < n and matrix[j][i] != 0:
+            while j < n and matrix[j][i] == 0:
                 j += 1
             if j < n:
                 swap_rows(matrix, i, j)
@@ -82,35 +271,218 @@ def gauss_elimination_mod(matrix: list[list[int]], mod: int):
                 add_mult_row(matrix, i, j, -matrix[j][i])
         # print_matrix(matrix)
     
-    for i in range(m - 2, -1, -1):
+    for i in range(m - num_rhs - 1, -1, -1):
         if matrix[i][i] != 0:
             for j in range(i - 1, -1, -1):
                 add_mult_row(matrix, i, j, -matrix[j][i])
         # print_matrix(matrix)
 
 
+class LUMod:
+    """LU factorization P A = L U of a square matrix A modulo a prime `mod`.
+
+    The matrix is factored once with a blocked right-looking algorithm: each
+    panel of `block_size` columns is factored with vector operations and the
+    trailing submatrix is updated with a single matrix product. The factors
+    can then solve any number of right-hand sides in O(n^2) each.
+
+    Uses int64 arrays for moduli below 2^31 and arrays of Python ints for
+    bigger moduli."""
+
+    def __init__(self, matrix: list[list[int]] | np.ndarray, mod: int,
+                 block_size: int = 64):
+        self._mod = mod
+        self._dtype = np.int64 if mod < 2 ** 31 else object
+        if block_size > 2 ** 16:
+            raise ValueError("block size too big for int64 accumulation")
+        a = (np.array(matrix, dtype=object) % mod).astype(self._dtype)
+        n = len(a)
+        if a.shape != (n, n):
+            raise ValueError("matrix must be square")
+        perm = np.arange(n)
+        for k0 in range(0, n, block_size):
+            k1 = min(k0 + block_size, n)
+            # Factor the panel a[k0:, k0:k1].
+            for j in range(k0, k1):
+                nonzero = np.flatnonzero(a[j:, j])
+                if not len(nonzero):
+                    raise ValueError(f"matrix is singular modulo {mod}")
+                r = j + nonzero[0]
+                if r != j:
+                    a[[j, r]] = a[[r, j]]
+                    perm[[j, r]] = perm[[r, j]]
+                inv = inv_mod(int(a[j, j]), mod)
+                a[j + 1:, j] = a[j + 1:, j] * inv % mod
+                a[j + 1:, j + 1:k1] = (
+                    a[j + 1:, j + 1:k1]
+                    - a[j + 1:, j, None] * a[j, j + 1:k1]) % mod
+            # U12 = L11^-1 A12.
+            for j in range(k0, k1):
+                a[j + 1:k1, k1:] = (
+                    a[j + 1:k1, k1:] - a[j + 1:k1, j, None] * a[j, k1:]) % mod
+            # A22 -= L21 U12.
+            a[k1:, k1:] = (a[k1:, k1:] - mul_mod(
+                a[k1:, k0:k1], a[k0:k1, k1:], mod)) % mod
+        self._lu = a
+        self._perm = perm
+        self._diagonal_inverses = np.array(
+            inv_mod_batch([int(d) for d in a.diagonal()], mod),
+            dtype=self._dtype)
+
+    @property
+    def size(self) -> int:
+        """Number of rows (and columns) of the factored matrix."""
+        return len(self._lu)
+
+    def solve(self, b: list[int] | np.ndarray) -> np.ndarray:
+        """Solves A x = b modulo `mod`.
+
+        `b` is either a vector or a matrix with one right-hand side per
+        column, in which case all of them are solved at once and x has the
+        same shape as `b`."""
+        mod = self._mod
+        lu = self._lu
+        x = (np.array(b, dtype=object) % mod).astype(self._dtype)
+        if x.shape[0] != self.size:
+            raise ValueError("b must have as many rows as the matrix")
+        vector = x.ndim == 1
+        if vector:
+            x = x[:, None]
+        x = x[self._perm]
+        # Forward substitution with the unit lower triangular L.
+        for i in range(self.size):
+            x[i + 1:] = (x[i + 1:] - lu[i + 1:, i, None] * x[i]) % mod
+        # Back substitution with U.
+        for i in range(self.size - 1, -1, -1):
+            x[i] = x[i] * self._diagonal_inverses[i] % mod
+            x[:i] = (x[:i] - lu[:i, i, None] * x[i]) % mod
+        return x[:, 0] if vector else x
+
+
+def solve_stream_mod(
+        matrix: list[list[int]] | np.ndarray,
+        rhs_stream: Iterable[list[int]], mod: int,
+        batch_size: int = 1024) -> Iterator[list[int]]:
+    """Solves matrix * x = b modulo prime `mod` for every b in `rhs_stream`.
+
+    The matrix is factored once and the right-hand sides are solved in
+    batches of up to `batch_size` columns. Yields the solutions in the order
+    of the stream."""
+    lu = LUMod(matrix, mod)
+    batch = []
+    for b in rhs_stream:
+        batch.append(b)
+        if len(batch) == batch_size:
+            yield from lu.solve(np.array(batch, dtype=object).T).T.tolist()
+            batch = []
+    if batch:
+        yield from lu.solve(np.array(batch, dtype=object).T).T.tolist()
+
+
+def solve_sparse_mod(
+        rows: list[dict[int, int]], rhs: list[int], mod: int) -> list[int]:
+    """Solves a sparse square system modulo prime `mod`.
+
+    Row i of the system is sum(rows[i][j] * x_j for j in rows[i]) = rhs[i],
+    i.e. every row maps column indices to its nonzero coefficients.
+
+    Pivots are chosen Markowitz-style to keep the fill-in low: the column
+    with the fewest nonzeros is eliminated next, using its shortest row as
+    the pivot row. Only rows with a nonzero in the pivot column are
+    touched, so elimination of systems with little fill-in scales to
+    hundreds of thousands of unknowns.
+
+    Raises ValueError if the system is singular."""
+    n = len(rows)
+    if len(rhs) != n:
+        raise ValueError("rows and rhs must be of equal length!")
+    rows = [
+        {j: v % mod for j, v in row.items() if v % mod} for row in rows
+    ]
+    rhs = [b % mod for b in rhs]
+    col_rows = [set() for _ in range(n)]
+    for i, row in enumerate(rows):
+        for j in row:
+            if not 0 <= j < n:
+                raise ValueError("the system must be square")
+            col_rows[j].add(i)
+    # Lazily updated heap of (number of nonzeros, column).
+    heap = [(len(r), j) for j, r in enumerate(col_rows)]
+    heapq.heapify(heap)
+    eliminated = [False for _ in range(n)]
+    pivots = []
+    while len(pivots) < n:
+        if not heap:
+            raise ValueError(f"matrix is singular modulo {mod}")
+        count, c = heapq.heappop(heap)
+        if eliminated[c] or count != len(col_rows[c]):
+            continue
+        if not count:
+            raise ValueError(f"matrix is singular modulo {mod}")
+        r = min(col_rows[c], key=lambda i: len(rows[i]))
+        pivot_row = rows[r]
+        for j in pivot_row:
+            col_rows[j].discard(r)
+        inv = inv_mod(pivot_row[c], mod)
+        for i in list(col_rows[c]):
+            row = rows[i]
+            f = row[c] * inv % mod
+            for j, v in pivot_row.items():
+                new = (row.get(j, 0) - f * v) % mod
+                if new:
+                    if j not in row:
+                        col_rows[j].add(i)
+                    row[j] = new
+                elif j in row:
+                    del row[j]
+                    col_rows[j].discard(i)
+            rhs[i] = (rhs[i] - f * rhs[r]) % mod
+        for j in pivot_row:
+            if j != c:
+                heapq.heappush(heap, (len(col_rows[j]), j))
+        eliminated[c] = True
+        pivots.append((r, c))
+    # Back substitution: a pivot row only refers to columns pivoted later.
+    x = [0 for _ in range(n)]
+    for r, c in reversed(pivots):
+        acc = rhs[r]
+        for j, v in rows[r].items():
+            if j != c:
+                acc -= v * x[j]
+        x[c] = acc * inv_mod(rows[r][c], mod) % mod
+    return x
+
+
 def polynomial_interpolation(
         points: list[tuple[int, int]], m: int) -> PolynomialModulo:
     """Interpolates a polynomial in modular arithmetic modulo `m`.
 
-    Uses Gauss elimination.
+    Solves the Vandermonde system V a = y in O(n^2) time and O(n) memory
+    without building V, in the manner of Bjorck-Pereyra: the Newton divided
+    differences are computed level by level (with a single batched inversion
+    per level) and then expanded into the monomial basis.
 
     Returns a polynomial of degree n going through all n+1 provided points.
 
     Points must be in format [x, y]."""
-    matrix = []
-    deg = len(points) - 1
-    for p in points:
-        x, y = p
-        matrix.append([
-            x ** j for j in range(deg + 1)
-        ] + [y])
-
-    gauss_elimination_mod(matrix, m)
-
-    return PolynomialModulo([
-        matrix[i][deg + 1] for i in range(deg + 1)
-    ], m)
+    dtype = np.int64 if m < 2 ** 31 else object
+    xs = np.array([x % m for x, _ in points], dtype=dtype)
+    c = np.array([y % m for _, y in points], dtype=dtype)
+    n = len(xs)
+    if len(set(xs.tolist())) != n:
+        raise ValueError("xs must be unique modulo m")
+    for k in range(1, n):
+        inverses = inv_mod_batch((xs[k:] - xs[:-k]) % m, m)
+        c[k:] = (c[k:] - c[k - 1:-1]) % m * inverses % m
+    coeffs = np.zeros(0, dtype=dtype)
+    for k in range(n - 1, -1, -1):
+        # coeffs = coeffs * (x - xs[k]) + c[k]
+        shifted = np.zeros(len(coeffs) + 1, dtype=dtype)
+        shifted[1:] = coeffs
+        shifted[:-1] = (shifted[:-1] - xs[k] * coeffs) % m
+        shifted[0] = (shifted[0] + c[k]) % m
+        coeffs = shifted
+    return PolynomialModulo(coeffs.tolist(), m)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,207 @@
+import unittest
+import numpy as np
+from fractions import Fraction
+from gauss_elimination import (
+    LUMod, condition_number, gauss_elimination, gauss_elimination_mod,
+    gauss_elimination_mod_numpy, polynomial_interpolation, solve,
+    solve_sparse_mod, solve_stream_mod)
+from polynomials_modulo import PolynomialModulo, lagrange_interpolation
+
+
+def _random_system(n: int, mod: int, seed: int) -> list[list[int]]:
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, mod, size=(n, n + 1)).tolist()
+
+
+class GaussEliminationTest(unittest.TestCase):
+
+    def test_polynomial_interpolation(self):
+        self.assertEqual(
+            polynomial_interpolation([(1, 200), (2, 500), (3, 1000)], 251),
+            PolynomialModulo([100, 0, 100], 251)
+        )
+
+    def test_polynomial_interpolation_matches_lagrange(self):
+        for m in [13, 10 ** 9 + 7, 2 ** 89 - 1]:
+            with self.subTest(m=m):
+                points = [(x, (x ** 5 + 3 * x + m - 1) % m)
+                          for x in [0, -2, 5, 10, 7, 1, 3]]
+                self.assertEqual(
+                    polynomial_interpolation(points, m),
+                    lagrange_interpolation(points, m))
+        with self.assertRaises(ValueError):
+            polynomial_interpolation([(1, 2), (14, 3)], 13)
+
+    def test_gauss_elimination_mod_engines(self):
+        for mod in [251, 2 ** 31 - 1, 2 ** 61 - 1]:
+            with self.subTest(mod):
+                matrix = _random_system(30, min(mod, 2 ** 62), mod % 1000)
+                python = [row.copy() for row in matrix]
+                gauss_elimination_mod(python, mod)
+                numpy = [row.copy() for row in matrix]
+                gauss_elimination_mod(numpy, mod, engine='numpy')
+                self.assertEqual(python, numpy)
+        # Zero pivots, which need a row swap.
+        for matrix in [[[0, 1, 2], [1, 0, 3]],
+                       [[0, 2, 1, 5], [0, 1, 3, 4], [4, 0, 1, 6]]]:
+            with self.subTest(matrix):
+                python = [row.copy() for row in matrix]
+                gauss_elimination_mod(python, 7)
+                numpy = [row.copy() for row in matrix]
+                gauss_elimination_mod(numpy, 7, engine='numpy')
+                self.assertEqual(python, numpy)
+
+    def test_gauss_elimination_mod_numpy_solves(self):
+        mod = 2 ** 31 - 1
+        matrix = np.array(_random_system(200, mod, 0), dtype=object)
+        reduced = gauss_elimination_mod_numpy(matrix, mod)
+        np.testing.assert_array_equal(
+            reduced[:, :200], np.eye(200, dtype=np.int64))
+        x = reduced[:, 200].astype(object)
+        np.testing.assert_array_equal(
+            (matrix[:, :200] @ x - matrix[:, 200]) % mod, 0)
+
+    def test_gauss_elimination_mod_numpy_swaps_rows(self):
+        reduced = gauss_elimination_mod_numpy([[0, 1, 2], [1, 0, 3]], 7)
+        self.assertEqual(reduced.tolist(), [[1, 0, 3], [0, 1, 2]])
+
+    def test_gauss_elimination_mod_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            gauss_elimination_mod([[1, 2]], 7, engine='fortran')
+
+    def test_gauss_elimination_multiple_rhs(self):
+        matrix = [[2., 1., 3., 1.], [1., 3., 4., -2.]]
+        gauss_elimination(matrix, num_rhs=2)
+        np.testing.assert_almost_equal(
+            matrix, [[1., 0., 1., 1.], [0., 1., 1., -1.]])
+
+    def test_gauss_elimination_partial_pivoting(self):
+        # Without pivoting on the largest entry, 1e-20 would be the pivot and
+        # the solution would be lost to rounding.
+        matrix = [[1e-20, 1., 1.], [1., 1., 2.]]
+        gauss_elimination(matrix)
+        np.testing.assert_almost_equal(matrix, [[1., 0., 1.], [0., 1., 1.]])
+        matrix = [[0., 1., 1.], [1., 0., 2.]]
+        gauss_elimination(matrix)
+        np.testing.assert_almost_equal(matrix, [[1., 0., 2.], [0., 1., 1.]])
+
+    def test_solve(self):
+        rng = np.random.default_rng(5)
+        a, b = rng.normal(size=(20, 20)), rng.normal(size=(20, 2))
+        for method in ['lapack', 'python']:
+            with self.subTest(method):
+                np.testing.assert_almost_equal(
+                    np.array(solve(a.tolist(), b.tolist(), method)),
+                    np.linalg.solve(a, b))
+                np.testing.assert_almost_equal(
+                    solve(a.tolist(), b[:, 0].tolist(), method),
+                    np.linalg.solve(a, b[:, 0]))
+                with self.assertRaises(ValueError):
+                    solve([[1., 2.], [2., 4.]], [1., 1.], method)
+        self.assertEqual(
+            solve([[Fraction(1), Fraction(2)], [Fraction(3), Fraction(4)]],
+                  [Fraction(1), Fraction(1)]),
+            [Fraction(-1), Fraction(1)])
+
+    def test_condition_number(self):
+        hilbert = [[1 / (i + j + 1) for j in range(8)] for i in range(8)]
+        exact = np.linalg.cond(np.array(hilbert), 1)
+        self.assertAlmostEqual(condition_number(hilbert) / exact, 1)
+        self.assertGreater(condition_number(hilbert, 'python') / exact, 0.1)
+        self.assertLessEqual(
+            condition_number(hilbert, 'python') / exact, 1 + 1e-6)
+        self.assertEqual(condition_number([[1., 2.], [2., 4.]], 'python'),
+                         float('inf'))
+        with self.assertRaises(ValueError):
+            solve(hilbert, [1.] * 8, max_condition=1e6)
+        with self.assertRaises(ValueError):
+            solve(hilbert, [1.] * 8, method='cholesky')
+
+    def test_gauss_elimination_mod_multiple_rhs(self):
+        system = _random_system(25, 251, 3)
+        rhs = [[3 * row[25] % 251, 7] for row in system]
+        for engine in ['python', 'numpy']:
+            with self.subTest(engine):
+                matrix = [row + r for row, r in zip(system, rhs)]
+                gauss_elimination_mod(matrix, 251, engine, num_rhs=3)
+                single = [row.copy() for row in system]
+                gauss_elimination_mod(single, 251, engine)
+                self.assertEqual([row[25] for row in matrix],
+                                 [row[25] for row in single])
+                self.assertEqual([row[26] for row in matrix],
+                                 [3 * row[25] % 251 for row in single])
+
+    def test_solve_stream_mod(self):
+        system = np.array(_random_system(15, 251, 4), dtype=object)
+        a = system[:, :15]
+        stream = (np.arange(15) * k % 251 for k in range(10))
+        solutions = list(solve_stream_mod(a, stream, 251, batch_size=4))
+        self.assertEqual(len(solutions), 10)
+        for k, x in enumerate(solutions):
+            np.testing.assert_array_equal(
+                (a @ np.array(x, dtype=object) - np.arange(15) * k) % 251, 0)
+
+    def test_lu_mod(self):
+        for mod in [13, 2 ** 31 - 1, 2 ** 61 - 1]:
+            with self.subTest(mod):
+                system = np.array(
+                    _random_system(70, min(mod, 2 ** 62), 1), dtype=object)
+                a, b = system[:, :70], system[:, 70]
+                lu = LUMod(a, mod, block_size=16)
+                x = lu.solve(b).astype(object)
+                np.testing.assert_array_equal((a @ x - b) % mod, 0)
+                rhs = np.stack([b, 2 * b + 1, np.zeros(70, dtype=object)], 1)
+                xs = lu.solve(rhs)
+                self.assertEqual(xs.shape, (70, 3))
+                np.testing.assert_array_equal(
+                    (a @ xs.astype(object) - rhs) % mod, 0)
+                np.testing.assert_array_equal(xs[:, 0], x)
+
+    def test_lu_mod_matches_elimination(self):
+        system = _random_system(20, 251, 2)
+        reduced = gauss_elimination_mod_numpy(system, 251)
+        lu = LUMod([row[:20] for row in system], 251)
+        np.testing.assert_array_equal(
+            lu.solve([row[20] for row in system]), reduced[:, 20])
+
+    def test_lu_mod_validates_input(self):
+        with self.assertRaises(ValueError):
+            LUMod([[1, 2], [2, 4]], 7)
+        with self.assertRaises(ValueError):
+            LUMod([[1, 2, 3], [2, 4, 5]], 7)
+        with self.assertRaises(ValueError):
+            LUMod([[1, 2], [3, 4]], 7).solve([1, 2, 3])
+
+    def test_solve_sparse_mod(self):
+        system = _random_system(30, 1009, 3)
+        rows = [
+            {j: v for j, v in enumerate(row[:30]) if v % 4 == 0}
+            for row in system
+        ]
+        for i, row in enumerate(rows):
+            row[i] = row.get(i, 0) + 1
+        x = solve_sparse_mod(rows, [row[30] for row in system], 1009)
+        for row, full in zip(rows, system):
+            self.assertEqual(
+                sum(v * x[j] for j, v in row.items()) % 1009, full[30])
+
+    def test_solve_sparse_mod_arrow(self):
+        # Eliminating the dense first column first would fill in the whole
+        # matrix; pivoting on sparse columns keeps it arrow-shaped.
+        n, mod = 2000, 10 ** 9 + 7
+        rows = [{0: 1, **{j: 1 for j in range(1, n)}}]
+        rows += [{0: i, i: 2} for i in range(1, n)]
+        x = solve_sparse_mod(rows, list(range(n)), mod)
+        for i, row in enumerate(rows):
+            self.assertEqual(sum(v * x[j] for j, v in row.items()) % mod, i)
+
+    def test_solve_sparse_mod_singular(self):
+        with self.assertRaises(ValueError):
+            solve_sparse_mod([{0: 1, 1: 2}, {0: 2, 1: 4}], [1, 2], 7)
+        with self.assertRaises(ValueError):
+            solve_sparse_mod([{0: 1}, {0: 3}], [1, 2], 7)
+        with self.assertRaises(ValueError):
+            solve_sparse_mod([{0: 1}, {2: 1}], [1, 2], 7)
+
+if __name__ == '__main__':
+    unittest.main()
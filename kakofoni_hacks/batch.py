@@ -0,0 +1,84 @@
+"""
+Compiles a catalog of melodies to kakofoni configs.
+
+Reads melodies from a JSONL file (one JSON list of notes per line) and writes
+their configs as JSONL, in the same order, to the output file or stdout.
+Melodies are encoded by a pool of worker processes; every worker precomputes
+the interpolation basis of the grid once and reuses it for all its melodies.
+Throughput is reported to stderr.
+
+Run as a module from the repository root, e.g.:
+    python -m kakofoni_hacks.batch melodies.jsonl --output configs.jsonl
+"""
+import argparse
+from collections.abc import Iterable, Iterator
+import json
+from multiprocessing import Pool
+import os
+import sys
+import time
+
+from polynomials_modulo import lagrange_basis
+from kakofoni_hacks.main import create_config_for_melody
+
+
+def _init_worker(p: int):
+    """Warms the cached Lagrange basis used for every melody."""
+    lagrange_basis(tuple(range(p)), p)
+
+
+def _compile(args: tuple[str, int]) -> str:
+    """Returns the config of a melody given as a JSON line, as a JSON line."""
+    line, p = args
+    return json.dumps(create_config_for_melody(json.loads(line), p))
+
+
+def compile_melodies(
+        lines: Iterable[str], p: int = 13, workers: int | None = None,
+        chunksize: int = 16) -> Iterator[str]:
+    """Yields the configs of melodies given as JSON lines, as JSON lines, in
+    the input order, compiled by a pool of `workers` processes."""
+    with Pool(workers, _init_worker, (p,)) as pool:
+        # imap keeps the input order while streaming the results.
+        tasks = ((line, p) for line in lines)
+        yield from pool.imap(_compile, tasks, chunksize)
+
+
+def read_melodies(path: str) -> Iterator[str]:
+    """Yields non-empty lines of a JSONL file."""
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield line
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                    prog='Compile melodies to kakofoni configs.')
+    parser.add_argument("input", help="JSONL file with a melody per line.")
+    parser.add_argument(
+        "--output", default=None,
+        help="Output JSONL file, stdout by default.")
+    parser.add_argument(
+        "--prime", type=int, default=13,
+        help="Prime p; melodies can have up to p^2 notes.")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count(),
+        help="Number of worker processes.")
+    parser.add_argument(
+        "--chunksize", type=int, default=16,
+        help="Number of melodies sent to a worker at once.")
+    args = parser.parse_args()
+
+    out = open(args.output, 'w') if args.output else sys.stdout
+    start = time.perf_counter()
+    count = 0
+    for config in compile_melodies(read_melodies(args.input), args.prime,
+                                   args.workers, args.chunksize):
+        out.write(config + '\n')
+        count += 1
+    if out is not sys.stdout:
+        out.close()
+    elapsed = time.perf_counter() - start
+    print(f"{count} melodies in {elapsed:.2f} s "
+          f"({count / elapsed:.1f} melodies/s)", file=sys.stderr)
@@ -0,0 +1,25 @@
+import json
+import os
+import tempfile
+import unittest
+from kakofoni_hacks.batch import compile_melodies, read_melodies
+from kakofoni_hacks.main import create_config_for_melody
+
+
+class BatchTest(unittest.TestCase):
+
+    def test_compile_melodies(self):
+        melodies = [[5, 12, 9], [0], [7] * 20, list(range(25)), [3, 1]]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'melodies.jsonl')
+            with open(path, 'w') as f:
+                for melody in melodies:
+                    f.write(json.dumps(melody) + '\n\n')
+            configs = list(compile_melodies(
+                read_melodies(path), 5, workers=2, chunksize=2))
+        self.assertEqual(
+            [json.loads(config) for config in configs],
+            [create_config_for_melody(melody, 5) for melody in melodies])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,62 +1,106 @@
 import gauss_elimination as ge
 import json
+import sys
 
-def create_transforms_for_melody(melody: list[int]) -> dict[str, str]:
+import numpy as np
+
+from multivariate_interpolation import tensor_interpolation
+
+
+def encode_melody(melody: list[int], p: int = 13) -> np.ndarray:
+    """Encodes a melody of at most p^2 notes in a bivariate polynomial modulo
+    prime `p`.
+
+    The melody is padded with 0s to m_0, m_1, ..., m_(p^2 - 1), with
+    m_(y * p + x) played at (x, y). It is encoded in a function
+    \\sum_{i < p, j < p} w_{ij} * y^i * x^j, interpolating one axis of the
+    grid at a time.
+
+    Returns the p x p array of weights w."""
+    melody = melody + [0 for _ in range(p * p - len(melody))]
+    return tensor_interpolation(
+        [melody[y * p:(y + 1) * p] for y in range(p)],
+        [range(p), range(p)], p
+    )
+
+
+def _horner(terms: list[str | None], var: str) -> str | None:
+    """Nests terms[k] * var^k Horner-style, skipping None (zero) terms.
+
+    E.g. ['3', None, '5', '7'] gives '3 + x^2 * (5 + x * 7)'."""
+    nonzero = [k for k, t in enumerate(terms) if t is not None]
+    if not nonzero:
+        return None
+
+    def power(k: int) -> str:
+        return var if k == 1 else f'{var}^{k}'
+
+    def factor(t: str) -> str:
+        return f'({t})' if '+' in t else t
+
+    expr = terms[nonzero[-1]]
+    for k, higher in zip(nonzero[-2::-1], nonzero[:0:-1]):
+        expr = f'{terms[k]} + {power(higher - k)} * {factor(expr)}'
+    if nonzero[0]:
+        expr = f'{power(nonzero[0])} * {factor(expr)}'
+    return expr
+
+
+def z_transform(weights: np.ndarray, form: str = 'horner') -> str:
+    """Writes the polynomial with `weights` from `encode_melody` as a
+    transform of z.
+
+    Form must be either "horner" or "expanded". The expanded form lists all
+    p^2 terms w_{ij} * x^j * y^i, zeros included. The Horner form drops
+    zero terms and nests the polynomial in y, with coefficients nested in x,
+    which is much cheaper to evaluate on every tick."""
+    p = len(weights)
+    if form == 'expanded':
+        return ' + '.join(
+            f'{weights[y, x]} * x^{x} * y^{y}'
+            for y in range(p) for x in range(p))
+    elif form != 'horner':
+        raise ValueError("unknown transform form")
+    rows = [
+        _horner([str(w) if w else None for w in weights[y]], 'x')
+        for y in range(p)
+    ]
+    return _horner(rows, 'y') or '0'
+
+
+def count_operations(expr: str) -> int:
+    """Number of binary operations (+, *, ^) in an unparsed transform."""
+    return sum(expr.count(op) for op in '+*^')
+
+
+def create_transforms_for_melody(
+        melody: list[int], p: int = 13, form: str = 'horner'
+) -> dict[str, str]:
     """Creates transfoms for variables to play the melody.
 
+    The melody is encoded on a p x p grid, so it may have up to p^2 notes.
+    See `z_transform` for the forms of the z transform.
+
     Returns a dict of unparsed transforms."""
     transforms = {}
     transforms['x'] = 'x + 1'
     transforms['ydelta'] = str(ge.polynomial_interpolation(
-        [(i, 0) for i in range(11)] + [(11, 1), (12, 0)], 13
+        [(i, 0) for i in range(p - 2)] + [(p - 2, 1), (p - 1, 0)], p
     ))
     transforms['y'] = 'y + ydelta'
-
-    # Pad melody with 0s.
-    melody += [0 for _ in range(169 - len(melody))]
-
-    # Melody is m_0, m_1, ..., m_169.
-    # We will encode it in a function \sum_{i < 13, j < 13} w_{ij} * y^i * x^j.
-    # Values of x, y:
-    # (0, 0), (1, 0), ..., (12, 0), (0, 1), (1, 1), ..., (12, 1), ..., (12, 12)
-    matrix = []
-    for y in range(13):
-        for x in range(13):
-            matrix.append([
-                ((y ** i) % 13) * ((x ** j) % 13) % 13
-                for i in range(13) for j in range(13)
-            ] + [melody[y * 13 + x]])
-    
-    ge.gauss_elimination_mod(matrix, 13)
-    # ge.print_matrix(matrix)
-
-    z_components = []
-    for y in range(13):
-        for x in range(13):
-            z_components.append(f'{matrix[y * 13 + x][169]} * x^{x} * y^{y}')
-    transforms['z'] = ' + '.join(z_components)
-
-    ### TEST
-    # results = []
-    # for y in range(13):
-    #     for x in range(13):
-    #         s = 0
-    #         for i in range(13):
-    #             for j in range(13):
-    #                 s += matrix[i * 13 + j][169] * (y ** i) * (x ** j) % 13
-    #         s %= 13
-    #         results.append(s == melody[y * 13 + x])
-
+    transforms['z'] = z_transform(encode_melody(melody, p), form)
     return transforms
 
 
-def create_config_for_melody(melody: list[int]) -> dict:
+def create_config_for_melody(
+        melody: list[int], p: int = 13, form: str = 'horner') -> dict:
     """Creates a config for melody.
     
-    For now, assumes len(melody) < 170.
+    Assumes len(melody) <= p^2, for a prime p. Longer melodies need a larger
+    prime.
     
     Returns config."""
-    assert len(melody) < 170, "longer melodies not supported yet"
+    assert len(melody) <= p * p, "melody too long for the given prime"
     
     result = {
         'variables': ['x', 'ydelta', 'y', 'z'],
@@ -66,7 +110,8 @@ def create_config_for_melody(melody: list[int]) -> dict:
             'y': 0,
             'z': melody[0],
         },
-        'unparsedVarTransforms': create_transforms_for_melody(melody),
+        'unparsedVarTransforms': create_transforms_for_melody(
+            melody, p, form),
         'playVariable': {
           'x': False,
           'ydelta': False,
@@ -93,4 +138,9 @@ if __name__ == '__main__':
       2, 0, 0, 0, 0, 0, 0,
     ]
     melody = melody * (169 // len(melody))
-    print(json.dumps(create_config_for_melody(melody)))
\ No newline at end of file
+    config = create_config_for_melody(melody)
+    print(json.dumps(config))
+    expanded = count_operations(z_transform(encode_melody(melody), 'expanded'))
+    compact = count_operations(config['unparsedVarTransforms']['z'])
+    print(f"z: {compact} operations per evaluation instead of {expanded} "
+          f"({expanded - compact} saved)", file=sys.stderr)
\ No newline at end of file
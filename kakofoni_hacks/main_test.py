@@ -0,0 +1,95 @@
+import unittest
+from kakofoni_hacks.main import (
+    _horner, count_operations, create_config_for_melody, encode_melody,
+    z_transform)
+
+P = 13
+MELODY = [
+    5,
+    12, 9, 9, 9, 7, 5, 5, 10,
+    10, 9, 9, 7, 7, 5, 5, 5,
+    12, 9, 9, 7, 7, 5, 5, 2,
+    2, 0, 0, 0, 0, 0, 0,
+]
+
+
+def eval_transform(expr: str, x: int, y: int, p: int) -> int:
+    return eval(expr.replace('^', '**'), {'x': x, 'y': y}) % p
+
+
+class KakofoniTest(unittest.TestCase):
+
+    def test_horner(self):
+        self.assertEqual(
+            _horner(['3', None, '5', '7'], 'x'), '3 + x^2 * (5 + x * 7)')
+        self.assertEqual(_horner([None, '2'], 'x'), 'x * 2')
+        self.assertEqual(_horner([None, None, '2 + x * 3'], 'y'),
+                         'y^2 * (2 + x * 3)')
+        self.assertIsNone(_horner([None, None], 'x'))
+
+    def test_z_transform_plays_melody(self):
+        melodies = [
+            MELODY * (P * P // len(MELODY)), MELODY, [0] * 40, [0], [7]]
+        for melody in melodies:
+            with self.subTest(melody=melody):
+                z = z_transform(encode_melody(melody, P))
+                padded = melody + [0] * (P * P - len(melody))
+                self.assertEqual(
+                    [eval_transform(z, x, y, P)
+                     for y in range(P) for x in range(P)],
+                    padded)
+
+    def test_z_transform_drops_zero_terms(self):
+        self.assertEqual(z_transform(encode_melody([0] * 40, P)), '0')
+        # (1 - x) (1 - y) modulo 2.
+        weights = encode_melody([1], 2)
+        self.assertEqual(
+            z_transform(weights), '1 + x * 1 + y * (1 + x * 1)')
+        weights = encode_melody([0, 0, 1], 2)
+        self.assertEqual(z_transform(weights), 'y * (1 + x * 1)')
+        z = z_transform(encode_melody(MELODY, P))
+        self.assertNotIn(' 0 ', z)
+        self.assertFalse(z.startswith('0 '))
+
+    def test_z_transform_expanded(self):
+        weights = encode_melody([1], 2)
+        self.assertEqual(
+            z_transform(weights, 'expanded'),
+            '1 * x^0 * y^0 + 1 * x^1 * y^0 + 1 * x^0 * y^1 + 1 * x^1 * y^1')
+        weights = encode_melody([0, 0, 1], 2)
+        self.assertEqual(
+            z_transform(weights, 'expanded'),
+            '0 * x^0 * y^0 + 0 * x^1 * y^0 + 1 * x^0 * y^1 + 1 * x^1 * y^1')
+        melody = MELODY * (P * P // len(MELODY))
+        weights = encode_melody(melody, P)
+        expanded = z_transform(weights, 'expanded')
+        self.assertEqual(
+            expanded.split(' + '),
+            [f'{weights[y, x]} * x^{x} * y^{y}'
+             for y in range(P) for x in range(P)])
+        self.assertEqual(
+            [eval_transform(expanded, x, y, P)
+             for y in range(P) for x in range(P)],
+            melody + [0] * (P * P - len(melody)))
+        self.assertLess(
+            count_operations(z_transform(weights)),
+            count_operations(expanded))
+        with self.assertRaises(ValueError):
+            z_transform(weights, 'factored')
+
+    def test_count_operations(self):
+        self.assertEqual(count_operations('3 + x^2 * (5 + x * 7)'), 5)
+        self.assertEqual(count_operations('0'), 0)
+
+    def test_create_config_for_melody(self):
+        config = create_config_for_melody(MELODY, P, 'expanded')
+        transforms = config['unparsedVarTransforms']
+        self.assertEqual(config['startState']['z'], MELODY[0])
+        self.assertEqual(
+            transforms['z'], z_transform(encode_melody(MELODY, P), 'expanded'))
+        self.assertEqual(
+            create_config_for_melody(MELODY, P)['unparsedVarTransforms']['z'],
+            z_transform(encode_melody(MELODY, P)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,27 @@
+from collections.abc import Callable
+from math import gcd
+
+import numpy as np
+
 from extended_euclidean_algorithm import egcd
 
+# Minimal number of values for which `inv_mod_batch` uses the NumPy path
+# (for moduli below 2^31).
+_INV_MOD_BATCH_NUMPY_THRESHOLD = 256
+
 def inv_mod(a: int, m: int):
     """Modular inversion.
     
-    Returns a^(-1) in modular arithmetic modulo m."""
+    Returns a^(-1) in modular arithmetic modulo m.
+
+    Python ints take a fast path through the built-in pow(a, -1, m), other
+    integer types (e.g. NumPy scalars) use the extended Euclidean
+    algorithm."""
+    if type(a) is int and type(m) is int:
+        try:
+            return pow(a, -1, m)
+        except ValueError:
+            raise ValueError(f"{a} is not invertible mod {m}") from None
     d, x, _ = egcd(a, m)
     if d > 1:
         raise ValueError(f"{a} is not invertible mod {m}")
@@ -14,4 +32,85 @@ def inv_mod(a: int, m: int):
 
 def div_mod(a: int, b: int, m: int):
     """Returns a / b in modular arithmetic modulo m."""
-    return a * inv_mod(b, m) % m
\ No newline at end of file
+    return a * inv_mod(b, m) % m
+
+
+def mul_mod(a: np.ndarray, b: np.ndarray, m: int,
+            product: Callable = np.matmul) -> np.ndarray:
+    """Returns product(a, b) modulo m for arrays with entries reduced modulo
+    m, where `product` is a bilinear product such as np.matmul (the default)
+    or np.convolve.
+
+    For int64 arrays (m < 2^31) `b` is split into 16-bit halves, so that
+    products stay below 2^47 and the sums of up to 2^16 of them fit in
+    int64; every entry of the product must sum at most 2^16 terms. Other
+    arrays (e.g. of Python ints) are multiplied directly."""
+    if a.dtype != np.int64:
+        return product(a, b) % m
+    low = product(a, b & 0xFFFF) % m
+    high = product(a, b >> 16) % m
+    return ((high << 16) + low) % m
+
+def _raise_first_not_invertible(values, m: int):
+    """Raises ValueError for the first of `values` not invertible mod m."""
+    for v in values:
+        if gcd(int(v), m) != 1:
+            raise ValueError(f"{v} is not invertible mod {m}")
+
+
+def _inv_mod_batch_numpy(values: np.ndarray, m: int) -> np.ndarray:
+    """Montgomery's trick vectorized with NumPy, for m < 2^31.
+
+    The prefix products are replaced by a binary product tree, so that every
+    level of the tree is a single vectorized multiplication."""
+    levels = [np.asarray(values, dtype=np.int64) % m]
+    while len(levels[-1]) > 1:
+        if len(levels[-1]) % 2:
+            levels[-1] = np.append(levels[-1], 1)
+        levels.append(levels[-1][0::2] * levels[-1][1::2] % m)
+    try:
+        inverses = np.array([inv_mod(int(levels[-1][0]), m)], dtype=np.int64)
+    except ValueError:
+        _raise_first_not_invertible(values, m)
+        raise
+    for level in levels[-2::-1]:
+        inverses = inverses[:len(level) // 2]
+        children = np.empty(len(level), dtype=np.int64)
+        children[0::2] = inverses * level[1::2] % m
+        children[1::2] = inverses * level[0::2] % m
+        inverses = children
+    return inverses[:len(values)]
+
+
+def inv_mod_batch(values: list[int] | np.ndarray, m: int) -> list[int] | np.ndarray:
+    """Modular inversion of many values at once.
+
+    Uses Montgomery's trick: a single `inv_mod` plus 3(n - 1)
+    multiplications for n values. For m < 2^31 and many values the
+    multiplications are vectorized with NumPy.
+
+    Returns the inverses modulo m, as an ndarray if `values` is one and as a
+    list otherwise."""
+    if not len(values):
+        return values[:0] if isinstance(values, np.ndarray) else []
+    if m < 2 ** 31 and (isinstance(values, np.ndarray)
+                        or len(values) >= _INV_MOD_BATCH_NUMPY_THRESHOLD):
+        inverses = _inv_mod_batch_numpy(values, m)
+        return inverses if isinstance(values, np.ndarray) else inverses.tolist()
+    if isinstance(values, np.ndarray):
+        return np.array(inv_mod_batch(values.tolist(), m), dtype=object)
+    prefix = []
+    acc = 1
+    for v in values:
+        prefix.append(acc)
+        acc = acc * v % m
+    try:
+        inv = inv_mod(acc, m)
+    except ValueError:
+        _raise_first_not_invertible(values, m)
+        raise
+    inverses = [0 for _ in values]
+    for i in range(len(values) - 1, -1, -1):
+        inverses[i] = inv * prefix[i] % m
+        inv = inv * values[i] % m
+    return inverses
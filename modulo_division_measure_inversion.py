@@ -0,0 +1,71 @@
+"""
+A simple micro-benchmark of modular inversion.
+
+For operands of 32, 64 and 4096 bits (modulo a random odd modulus of the same
+size) it measures the average time of a single:
+  * `egcd` call,
+  * `inv_mod` call through the extended Euclidean algorithm,
+  * `inv_mod` call through the built-in pow(a, -1, m) fast path,
+  * inversion within `inv_mod_batch` (the batch time divided by its size).
+"""
+
+import argparse
+from math import gcd
+from random import getrandbits
+from timeit import timeit
+from extended_euclidean_algorithm import egcd
+from modulo_division import inv_mod, inv_mod_batch
+
+
+def gen_operands(bits: int, n: int) -> tuple[list[int], int]:
+    """Generates a random odd `bits`-bit modulus and `n` operands invertible
+    modulo it."""
+    m = getrandbits(bits) | (1 << (bits - 1)) | 1
+    values = []
+    while len(values) < n:
+        a = getrandbits(bits) % m
+        if gcd(a, m) == 1:
+            values.append(a)
+    return values, m
+
+
+def inv_mod_egcd(a: int, m: int) -> int:
+    """Modular inversion through the extended Euclidean algorithm, i.e. the
+    path `inv_mod` takes for non-int operands."""
+    _, x, _ = egcd(a, m)
+    return x % m
+
+
+def per_call(f, values: list[int], rounds: int) -> float:
+    """Average time (in seconds) of calling `f` on a single value."""
+    return timeit(
+        lambda: [f(a) for a in values], number=rounds
+    ) / (rounds * len(values))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                    prog='Measure modular inversion.')
+    parser.add_argument(
+        "--bits", type=int, nargs="+", default=[32, 64, 4096],
+        help="Sizes of the operands in bits.")
+    parser.add_argument(
+        "--n", type=int, default=1000, help="Number of operands.")
+    parser.add_argument(
+        "--rounds", type=int, default=5,
+        help="Number of rounds to average over."
+    )
+    args = parser.parse_args()
+
+    print("bits", "egcd", "inv_mod/egcd", "inv_mod/pow", "inv_mod_batch",
+          sep="\t")
+    for bits in args.bits:
+        values, m = gen_operands(bits, args.n)
+        row = [
+            per_call(lambda a: egcd(a, m), values, args.rounds),
+            per_call(lambda a: inv_mod_egcd(a, m), values, args.rounds),
+            per_call(lambda a: inv_mod(a, m), values, args.rounds),
+            timeit(lambda: inv_mod_batch(values, m), number=args.rounds)
+            / (args.rounds * len(values)),
+        ]
+        print(bits, *["%.2e" % t for t in row], sep="\t")
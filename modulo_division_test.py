@@ -1,5 +1,6 @@
 import unittest
-from modulo_division import inv_mod, div_mod
+import numpy as np
+from modulo_division import inv_mod, div_mod, inv_mod_batch, mul_mod
 
 class ModuloDivisionTest(unittest.TestCase):
     
@@ -8,6 +9,12 @@ class ModuloDivisionTest(unittest.TestCase):
         self.assertEqual(inv_mod(4, 11), 3)
         self.assertEqual(inv_mod(3, 4), 3)
     
+    def test_div_inv_numpy_scalars(self):
+        self.assertEqual(inv_mod(np.int64(4), 11), 3)
+        self.assertEqual(inv_mod(np.int64(3), np.int64(4)), 3)
+        with self.assertRaises(ValueError):
+            inv_mod(np.int64(12), 15)
+
     def test_div_inv_not_invertible(self):
         with self.assertRaises(ValueError):
             inv_mod(12, 15)
@@ -16,6 +23,30 @@ class ModuloDivisionTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             inv_mod(28, 14)
     
+    def test_inv_mod_batch(self):
+        values = [11, 4, 7, 1, 14, 8]
+        self.assertEqual(
+            inv_mod_batch(values, 15), [inv_mod(v, 15) for v in values])
+        self.assertEqual(inv_mod_batch([], 15), [])
+
+    def test_inv_mod_batch_numpy(self):
+        values = np.arange(1, 1000)
+        inverses = inv_mod_batch(values, 1009)
+        self.assertIsInstance(inverses, np.ndarray)
+        np.testing.assert_array_equal(values * inverses % 1009, 1)
+        self.assertEqual(
+            inv_mod_batch(list(range(1, 1000)), 1009), inverses.tolist())
+        big = 2 ** 61 - 1
+        self.assertEqual(
+            list(inv_mod_batch(np.array([2, 3]), big)),
+            [inv_mod(2, big), inv_mod(3, big)])
+
+    def test_inv_mod_batch_not_invertible(self):
+        with self.assertRaisesRegex(ValueError, "12 is not invertible"):
+            inv_mod_batch([11, 12, 4], 15)
+        with self.assertRaisesRegex(ValueError, "12 is not invertible"):
+            inv_mod_batch(np.array([11, 12, 4]), 15)
+
     def test_div_mod(self):
         self.assertEqual(div_mod(11, 15, 23), 13)
 
@@ -23,5 +54,19 @@ class ModuloDivisionTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             div_mod(11, 15, 30)
 
+    def test_mul_mod(self):
+        m = 2 ** 31 - 1
+        rng = np.random.default_rng(0)
+        a = rng.integers(m - 1000, m, (3, 2 ** 16))
+        b = rng.integers(m - 1000, m, (2 ** 16, 2))
+        expected = a.astype(object) @ b.astype(object) % m
+        np.testing.assert_array_equal(mul_mod(a, b, m), expected)
+        np.testing.assert_array_equal(
+            mul_mod(a.astype(object), b.astype(object), m), expected)
+        a, b = a[0, :1000], b[:1000, 0]
+        np.testing.assert_array_equal(
+            mul_mod(a, b, m, np.convolve),
+            np.convolve(a.astype(object), b.astype(object)) % m)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,58 @@
+"""
+Tensor-product interpolation of multivariate polynomials modulo a prime.
+
+Values on a grid nodes[0] x nodes[1] x ... x nodes[d-1] determine a unique
+polynomial of degree below len(nodes[k]) in the k-th variable. Instead of
+solving the dense (N^d) x (N^d) system, the grid is interpolated one axis at
+a time: along axis k, every fiber of values is multiplied by the Lagrange
+basis of nodes[k]. For an N x N grid this costs O(N^3) instead of O(N^6).
+"""
+import numpy as np
+
+from modulo_division import mul_mod
+from polynomials_modulo import lagrange_basis
+
+
+def tensor_interpolation(
+        values: list | np.ndarray, nodes: list[list[int]], m: int
+) -> np.ndarray:
+    """Interpolates a polynomial in d variables modulo prime `m`.
+
+    `values` has d dimensions, values[i_0, ..., i_(d-1)] being the value at
+    (nodes[0][i_0], ..., nodes[d-1][i_(d-1)]).
+
+    Returns an array of coefficients of the same shape, where
+    coeffs[j_0, ..., j_(d-1)] is the coefficient of
+    x_0^j_0 * ... * x_(d-1)^j_(d-1)."""
+    dtype = np.int64 if m < 2 ** 31 else object
+    coeffs = np.array(values, dtype=object) % m
+    coeffs = coeffs.astype(dtype)
+    if coeffs.ndim != len(nodes):
+        raise ValueError("values must have one dimension per variable")
+    for axis, xs in enumerate(nodes):
+        if coeffs.shape[axis] != len(xs):
+            raise ValueError(f"expected {len(xs)} values along axis {axis}")
+        xs = tuple(x % m for x in xs)
+        if len(set(xs)) != len(xs):
+            raise ValueError("nodes must be unique modulo m")
+        # Row i of the basis holds the coefficients of L_i, so interpolation
+        # of all fibers along the axis is a single matrix product.
+        basis = lagrange_basis(xs, m)
+        fibers = np.moveaxis(coeffs, axis, -1)
+        shape = fibers.shape
+        fibers = mul_mod(fibers.reshape(-1, len(xs)), basis, m)
+        coeffs = np.moveaxis(fibers.reshape(shape), -1, axis)
+    return coeffs
+
+
+def tensor_eval(coeffs: np.ndarray, point: list[int], m: int) -> int:
+    """Evaluates the polynomial with coefficients `coeffs` (as returned by
+    `tensor_interpolation`) at `point` modulo `m`, with the Horner method
+    along each axis."""
+    result = np.asarray(coeffs, dtype=object)
+    for x in reversed(point):
+        acc = np.zeros(result.shape[:-1], dtype=object)
+        for j in range(result.shape[-1] - 1, -1, -1):
+            acc = (acc * x + result[..., j]) % m
+        result = acc
+    return int(result)
@@ -0,0 +1,40 @@
+import unittest
+import numpy as np
+from multivariate_interpolation import tensor_eval, tensor_interpolation
+
+
+class MultivariateInterpolationTest(unittest.TestCase):
+
+    def test_tensor_interpolation(self):
+        for m in [13, 10 ** 9 + 7, 2 ** 89 - 1]:
+            with self.subTest(m=m):
+                nodes = [[0, 5, -1], [2, 3], [7, 1, 4, 9]]
+                rng = np.random.default_rng(m % 1000)
+                values = rng.integers(0, 13, size=(3, 2, 4))
+                coeffs = tensor_interpolation(values, nodes, m)
+                self.assertEqual(coeffs.shape, (3, 2, 4))
+                for i, x in enumerate(nodes[0]):
+                    for j, y in enumerate(nodes[1]):
+                        for k, z in enumerate(nodes[2]):
+                            self.assertEqual(
+                                tensor_eval(coeffs, [x, y, z], m),
+                                values[i, j, k])
+
+    def test_tensor_interpolation_monomial(self):
+        # 3 + 2 * x * y^2 on a 3 x 3 grid.
+        grid = range(3)
+        values = [[(3 + 2 * x * y * y) % 7 for y in grid] for x in grid]
+        coeffs = tensor_interpolation(values, [grid, grid], 7)
+        np.testing.assert_array_equal(
+            coeffs, [[3, 0, 0], [0, 0, 2], [0, 0, 0]])
+
+    def test_tensor_interpolation_validates_input(self):
+        with self.assertRaises(ValueError):
+            tensor_interpolation([[1, 2], [3, 4]], [[0, 1]], 7)
+        with self.assertRaises(ValueError):
+            tensor_interpolation([[1, 2], [3, 4]], [[0, 1], [0, 1, 2]], 7)
+        with self.assertRaises(ValueError):
+            tensor_interpolation([[1, 2], [3, 4]], [[0, 7], [0, 1]], 7)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+"""Number-theoretic transform (NTT) and exact multiplication of polynomials
+in modular arithmetic.
+
+https://cp-algorithms.com/algebra/fft.html#number-theoretic-transform
+
+Moduli of the form c * 2^k + 1 are multiplied with a single NTT. Other moduli
+smaller than 2^31 are handled by three NTTs modulo the fixed `NTT_PRIMES`,
+followed by CRT recombination with `crt_solver.crt_solve_many`.
+
+All arithmetic is done in NumPy int64 arrays, so moduli must be smaller than
+2^31 (the product of two residues must fit in 63 bits).
+"""
+from functools import lru_cache
+
+from crt_solver import crt_solve_many
+import numpy as np
+
+# Primes of the form c * 2^k + 1 with k >= 23, used for the three-prime NTT.
+NTT_PRIMES = [998244353, 167772161, 469762049]
+
+_MAX_MODULUS = 2 ** 31
+
+
+@lru_cache(maxsize=None)
+def _is_prime(p: int) -> bool:
+    """Deterministic Miller-Rabin test for p < 2^32."""
+    if p < 2:
+        return False
+    for q in [2, 3, 5, 7, 11, 13]:
+        if p % q == 0:
+            return p == q
+    d, s = p - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in [2, 7, 61]:
+        x = pow(a, d, p)
+        if x in (1, p - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % p
+            if x == p - 1:
+                break
+        else:
+            return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _primitive_root(p: int) -> int:
+    """Smallest generator of the multiplicative group modulo prime `p`."""
+    factors = []
+    n, q = p - 1, 2
+    while q * q <= n:
+        if n % q == 0:
+            factors.append(q)
+            while n % q == 0:
+                n //= q
+        q += 1
+    if n > 1:
+        factors.append(n)
+    g = 2
+    while any(pow(g, (p - 1) // q, p) == 1 for q in factors):
+        g += 1
+    return g
+
+
+def is_ntt_friendly(p: int, size: int) -> bool:
+    """True iff an NTT of length `size` (a power of 2) exists modulo `p`."""
+    return p < _MAX_MODULUS and (p - 1) % size == 0 and _is_prime(p)
+
+
+def _powers(w: int, n: int, p: int) -> np.ndarray:
+    """Returns [w^0, w^1, ..., w^(n-1)] modulo `p`."""
+    powers = np.ones(1, dtype=np.int64)
+    while len(powers) < n:
+        step = pow(w, len(powers), p)
+        powers = np.concatenate((powers, powers * step % p))
+    return powers[:n]
+
+
+@lru_cache(maxsize=32)
+def _bit_reversal(n: int) -> np.ndarray:
+    """Bit-reversal permutation of range(n), for n being a power of 2."""
+    rev = np.zeros(n, dtype=np.int64)
+    bits = n.bit_length() - 1
+    for b in range(bits):
+        rev |= ((np.arange(n) >> b) & 1) << (bits - 1 - b)
+    return rev
+
+
+def ntt(a: np.ndarray, p: int, invert: bool = False) -> np.ndarray:
+    """Number-theoretic transform of `a` modulo prime `p`.
+
+    The length of `a` must be a power of 2 dividing p - 1. With `invert`
+    computes the inverse transform instead."""
+    n = len(a)
+    if not is_ntt_friendly(p, n):
+        raise ValueError(f"no NTT of length {n} modulo {p}")
+    w = pow(_primitive_root(p), (p - 1) // n, p)
+    if invert:
+        w = pow(w, -1, p)
+    twiddles = _powers(w, max(n // 2, 1), p)
+    a = np.asarray(a, dtype=np.int64)[_bit_reversal(n)] % p
+    length = 2
+    while length <= n:
+        half = length // 2
+        blocks = a.reshape(-1, length)
+        u = blocks[:, :half]
+        v = blocks[:, half:] * twiddles[::n // length] % p
+        a = np.concatenate(((u + v) % p, (u - v) % p), axis=1).reshape(n)
+        length *= 2
+    if invert:
+        a = a * pow(n, -1, p) % p
+    return a
+
+
+def _ntt_convolve(a: np.ndarray, b: np.ndarray, p: int) -> np.ndarray:
+    """Cyclic-free convolution of `a` and `b` modulo NTT-friendly `p`."""
+    n = len(a) + len(b) - 1
+    size = 1 << (n - 1).bit_length()
+    fa = ntt(np.pad(a % p, (0, size - len(a))), p)
+    fb = ntt(np.pad(b % p, (0, size - len(b))), p)
+    return ntt(fa * fb % p, p, invert=True)[:n]
+
+
+def ntt_multiply(a: list[int], b: list[int], m: int) -> list[int]:
+    """Exact product of polynomials with coefficients `a` and `b` modulo `m`.
+
+    Uses a single NTT if `m` is an NTT-friendly prime and three NTTs modulo
+    `NTT_PRIMES` recombined with CRT otherwise.
+
+    Coefficients must be already reduced modulo `m`."""
+    if not len(a) or not len(b):
+        return []
+    if m >= _MAX_MODULUS:
+        raise ValueError("modulus must be smaller than 2^31")
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    n = len(a) + len(b) - 1
+    size = 1 << (n - 1).bit_length()
+    if is_ntt_friendly(m, size):
+        return _ntt_convolve(a, b, m).tolist()
+    bound = 1
+    for p in NTT_PRIMES:
+        bound *= p
+        if not is_ntt_friendly(p, size):
+            raise ValueError("polynomials are too long for the NTT")
+    if min(len(a), len(b)) * (m - 1) ** 2 >= bound:
+        raise ValueError("polynomials are too long for the three-prime NTT")
+    residues = [_ntt_convolve(a, b, p) for p in NTT_PRIMES]
+    return crt_solve_many(NTT_PRIMES, residues, m).tolist()
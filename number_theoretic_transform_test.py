@@ -0,0 +1,56 @@
+import unittest
+import numpy as np
+from random import Random
+from number_theoretic_transform import (
+    NTT_PRIMES, is_ntt_friendly, ntt, ntt_multiply)
+
+
+def _schoolbook(a: list[int], b: list[int], m: int) -> list[int]:
+    c = [0 for _ in range(len(a) + len(b) - 1)]
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            c[i + j] = (c[i + j] + x * y) % m
+    return c
+
+
+class NumberTheoreticTransformTest(unittest.TestCase):
+
+    def test_is_ntt_friendly(self):
+        for p in NTT_PRIMES:
+            self.assertTrue(is_ntt_friendly(p, 2 ** 23))
+        self.assertTrue(is_ntt_friendly(17, 16))
+        self.assertFalse(is_ntt_friendly(17, 32))
+        self.assertFalse(is_ntt_friendly(1000000007, 4))
+        self.assertFalse(is_ntt_friendly(2 ** 32 + 1, 2))
+
+    def test_ntt_inverse(self):
+        rng = Random(0)
+        a = np.array([rng.randrange(998244353) for _ in range(64)])
+        f = ntt(a, 998244353)
+        np.testing.assert_array_equal(ntt(f, 998244353, invert=True), a)
+        with self.assertRaises(ValueError):
+            ntt(a, 1000000007)
+
+    def test_ntt_is_evaluation_at_roots_of_unity(self):
+        # 4 is a primitive 4th root of unity modulo 17.
+        a = [1, 2, 3, 4]
+        f = ntt(np.array(a), 17).tolist()
+        values = [sum(c * pow(w, i, 17) for i, c in enumerate(a)) % 17
+                  for w in [1, 4, 16, 13]]
+        self.assertEqual(sorted(f), sorted(values))
+
+    def test_ntt_multiply(self):
+        rng = Random(1)
+        for m in [998244353, 1000000007, 13, 2 ** 31 - 1]:
+            with self.subTest(m):
+                a = [rng.randrange(m) for _ in range(100)]
+                b = [rng.randrange(m) for _ in range(37)]
+                self.assertEqual(ntt_multiply(a, b, m), _schoolbook(a, b, m))
+        self.assertEqual(ntt_multiply([], [1, 2], 13), [])
+
+    def test_ntt_multiply_validates_modulus(self):
+        with self.assertRaises(ValueError):
+            ntt_multiply([1], [1], 2 ** 61 - 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,25 +2,92 @@
 # class.
 # https://stackoverflow.com/a/42845998
 from __future__ import annotations
-from functools import reduce
+from concurrent.futures import ThreadPoolExecutor
+from math import sqrt
+import os
 from random import random
 
+import numpy as np
+
 from divided_differences import DividedDifferences
 
 _EQ_EPS = 1e-4
 
+_BACKENDS = ('list', 'numpy')
+
+# Minimal number of coefficients of both factors for which `Polynomial.__mul__`
+# switches from the schoolbook algorithm to the FFT convolution, per backend.
+# See polynomials_measure_fft_crossover.py.
+_FFT_MUL_THRESHOLD = {'list': 32, 'numpy': 512}
+
+# Minimal length of both the divisor and the quotient for which
+# `Polynomial.__divmod__` switches from long division to Newton's iteration.
+_NEWTON_DIV_THRESHOLD = 16
+
+def _fft_convolve(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Convolution of `a` and `b` computed with a real FFT."""
+    n = len(a) + len(b) - 1
+    size = 1 << (n - 1).bit_length()
+    return np.fft.irfft(np.fft.rfft(a, size) * np.fft.rfft(b, size), size)[:n]
+
+def fft_mul_error_bound(a: Polynomial, b: Polynomial) -> float:
+    """Upper bound on the absolute error of any coefficient of `a * b`
+    computed with the FFT, compared to the exact product.
+
+    Follows Percival, "Rapid multiplication modulo the sum and difference of
+    highly composite numbers", Theorem 5.1, assuming correctly rounded
+    twiddle factors."""
+    if not len(a._coeffs) or not len(b._coeffs):
+        return 0.
+    n = len(a._coeffs) + len(b._coeffs) - 1
+    levels = max((n - 1).bit_length(), 1)
+    eps = np.finfo(np.float64).eps / 2
+    growth = ((1 + eps) ** (3 * levels)
+              * (1 + eps * sqrt(5)) ** (3 * levels + 1)
+              * (1 + eps) ** (3 * levels) - 1)
+    norm_a = float(np.linalg.norm(np.asarray(a._coeffs, dtype=np.float64)))
+    norm_b = float(np.linalg.norm(np.asarray(b._coeffs, dtype=np.float64)))
+    return norm_a * norm_b * growth
+
 class Polynomial:
-    """Representation of a Polynomial. Not necessarily efficient."""
+    """Representation of a Polynomial. Not necessarily efficient.
+
+    Coefficients are stored in a Python list by default. With
+    `backend='numpy'` they are stored in a contiguous float64 ndarray and
+    addition, subtraction, scaling, multiplication and derivative are
+    vectorized. Results of operations on mixed backends use numpy."""
     def __init__(self,
-                 coeffs: list[float]):
+                 coeffs: list[float] | np.ndarray,
+                 backend: str = 'list'):
+        if backend not in _BACKENDS:
+            raise ValueError("unknown backend: %s" % backend)
+        self._backend = backend
+        if backend == 'numpy':
+            coeffs = np.asarray(coeffs, dtype=np.float64)
+            nonzero = np.flatnonzero(coeffs)
+            length = nonzero[-1] + 1 if len(nonzero) else 0
+            self._coeffs = np.ascontiguousarray(coeffs[:length])
+            return
+        if isinstance(coeffs, np.ndarray):
+            coeffs = coeffs.tolist()
         self._coeffs = coeffs
         while len(self._coeffs) and self._coeffs[-1] == 0:
             self._coeffs.pop()
-    
+
     @staticmethod
-    def xpow(a: float, pow: int) -> Polynomial:
+    def xpow(a: float, pow: int, backend: str = 'list') -> Polynomial:
         """A helper util creating a polynomial a * x^pow."""
-        return Polynomial([0] * pow + [a])
+        return Polynomial([0] * pow + [a], backend)
+
+    @property
+    def backend(self) -> str:
+        """Name of the coefficient storage backend."""
+        return self._backend
+
+    def _uses_numpy(self, other: Polynomial | None = None) -> bool:
+        """True iff an operation on self and `other` should use numpy."""
+        return self._backend == 'numpy' or (
+            other is not None and other._backend == 'numpy')
 
     @property
     def coeffs(self):
@@ -34,20 +101,23 @@ class Polynomial:
 
     def derivative(self) -> Polynomial:
         """Returns a derivative of self."""
+        if self._uses_numpy():
+            return Polynomial(
+                self._coeffs[1:] * np.arange(1, len(self._coeffs)), 'numpy')
         return Polynomial([c * (i + 1) for i, c in enumerate(self._coeffs[1:])])
 
     def evaluate(self, x0: float) -> float:
         """Evaluates self at `x0`, using Horner method."""
-        return reduce(
-          lambda acc, coeff: acc * x0 + coeff,
-          self._coeffs[::-1],
-          0)
+        return self.eval(x0)
 
     def __eq__(self, value: object) -> bool:
         if isinstance(value, Polynomial):
-            if len(self._coeffs) != len(value.coeffs):
+            if len(self._coeffs) != len(value._coeffs):
                 return False
-            for (c1, c2) in zip(self._coeffs, value.coeffs):
+            if self._uses_numpy(value):
+                diff = np.subtract(self._coeffs, value._coeffs)
+                return not np.any(np.abs(diff) > _EQ_EPS)
+            for (c1, c2) in zip(self._coeffs, value._coeffs):
                 if abs(c1 - c2) > _EQ_EPS:
                     return False
             return True
@@ -55,6 +125,11 @@ class Polynomial:
         return self.__eq__(Polynomial([value]))
     
     def __add__(self, other: Polynomial) -> Polynomial:
+        if self._uses_numpy(other):
+            new_coeffs = np.zeros(max(len(self._coeffs), len(other._coeffs)))
+            new_coeffs[:len(self._coeffs)] += self._coeffs
+            new_coeffs[:len(other._coeffs)] += other._coeffs
+            return Polynomial(new_coeffs, 'numpy')
         new_coeffs = [0 for _ in range(max(self.degree, other.degree) + 1)]
         for i, coeff in enumerate(self.coeffs):
             new_coeffs[i] += coeff
@@ -64,10 +139,38 @@ class Polynomial:
         return Polynomial(new_coeffs)
     
     def __mul__(self, other: Polynomial | float | int) -> Polynomial:
-        if type(other) in [int, float]:
+        if not isinstance(other, Polynomial):
+            if self._uses_numpy():
+                return Polynomial(self._coeffs * other, 'numpy')
             return Polynomial(
                 [other * c for c in self._coeffs]
             )
+        return self.multiply(other)
+
+    def multiply(self, other: Polynomial, method: str = 'auto') -> Polynomial:
+        """Multiplies self by `other`.
+
+        Method must be one of "auto", "schoolbook" or "fft". "auto" uses the
+        FFT once both factors have at least `_FFT_MUL_THRESHOLD[backend]`
+        coefficients. The FFT product is not exact: see
+        `fft_mul_error_bound`."""
+        backend = 'numpy' if self._uses_numpy(other) else 'list'
+        if not len(self._coeffs) or not len(other._coeffs):
+            return Polynomial([], backend)
+        if method == 'auto':
+            method = 'fft' if min(
+                len(self._coeffs), len(other._coeffs)
+            ) >= _FFT_MUL_THRESHOLD[backend] else 'schoolbook'
+        if method == 'fft':
+            coeffs = _fft_convolve(
+                np.asarray(self._coeffs, dtype=np.float64),
+                np.asarray(other._coeffs, dtype=np.float64))
+            return Polynomial(coeffs, backend)
+        if method != 'schoolbook':
+            raise ValueError("unknown multiplication method")
+        if backend == 'numpy':
+            return Polynomial(
+                np.convolve(self._coeffs, other._coeffs), 'numpy')
         coeffs = [0 for _ in range(len(self._coeffs) + len(other.coeffs))]
         for i, c1 in enumerate(self._coeffs):
             for j, c2 in enumerate(other.coeffs):
@@ -81,7 +184,7 @@ class Polynomial:
         return self + -other
     
     def __str__(self) -> str:
-        if not self._coeffs:
+        if not len(self._coeffs):
             return "0"
         s = []
         for i, c in enumerate(self._coeffs):
@@ -96,6 +199,9 @@ class Polynomial:
         return " + ".join(s)
 
     def __repr__(self) -> str:
+        if self._uses_numpy():
+            return "Polynomial(%s, backend='numpy')" % str(
+                self._coeffs.tolist())
         return "Polynomial(%s)" % str(self._coeffs)
     
     def is_constant(self) -> bool:
@@ -125,35 +231,84 @@ class Polynomial:
         for c in self._coeffs[-2::-1]:
             r[i] = c - r[i + 1] * d.coeffs[0]
             i -= 1
-        return Polynomial(r[1:]), Polynomial([r[0]])
+        return (Polynomial(r[1:], self._backend),
+                Polynomial([r[0]], self._backend))
 
     def long_division(self, d: Polynomial) -> tuple[Polynomial, Polynomial]:
         """Performs long division of self by `d`.
+
+        Each quotient term updates a single working array in place. The
+        leading term of the remainder is dropped rather than subtracted, as
+        it would not always cancel exactly in floating point.
         
         Returns a pair (quotient, remainder)."""
         if d == 0:
             # TODO: Reconsider raise vs return.
             # Raise is slightly easier to test.
             raise ValueError("The divisor must be non zero.")
-        r = self  # Remainder
-        q = Polynomial([])  # Quotient
-        while r != 0 and r.degree >= d.degree:
-            t = self.xpow(
-                r.coeffs[-1] / d.coeffs[-1],
-                r.degree - d.degree
-            )
-            q = q + t
-            r = r - t * d
-        return (q, r)
+        r = np.array(self._coeffs, dtype=np.result_type(
+            np.asarray(self._coeffs), np.asarray(d._coeffs), np.float64))
+        b = np.asarray(d._coeffs, dtype=r.dtype)
+        q = np.zeros(max(len(r) - len(b) + 1, 0), dtype=r.dtype)
+        for top in range(len(r) - 1, len(b) - 2, -1):
+            start = top - len(b) + 1
+            q[start] = r[top] / b[-1]
+            r[start:top] -= q[start] * b[:-1]
+        return (Polynomial(q, self._backend),
+                Polynomial(r[:len(b) - 1], self._backend))
   
-    def __truediv__(self, other: Polynomial) -> tuple[Polynomial, Polynomial]:
+    def newton_division(self, d: Polynomial) -> tuple[Polynomial, Polynomial]:
+        """Performs division of self by `d` through Newton's iteration.
+
+        With n = deg(self) and k = deg(d), the reversed quotient is
+        rev(self) / rev(d) modulo x^(n - k + 1). The inverse series of rev(d)
+        is computed by Newton's iteration g <- g (2 - rev(d) g), which
+        doubles the number of correct terms per step, so the division costs
+        O(log n) vectorized convolutions instead of n - k + 1 row updates.
+
+        The convolutions are direct rather than through the FFT: quotient
+        coefficients span many orders of magnitude, and the absolute error
+        of the FFT would swamp the small ones.
+
+        Returns a pair (quotient, remainder)."""
+        if d == 0:
+            raise ValueError("The divisor must be non zero.")
+        a = np.asarray(self._coeffs, dtype=np.float64)
+        b = np.asarray(d._coeffs, dtype=np.float64)
+        if len(a) < len(b):
+            return (Polynomial([], self._backend), self)
+        size = len(a) - len(b) + 1
+        rev_b = b[::-1][:size]
+        inverse = np.array([1 / rev_b[0]])
+        k = 1
+        while k < size:
+            k = min(2 * k, size)
+            e = -np.convolve(rev_b[:k], inverse)[:k]
+            e[0] += 2
+            inverse = np.convolve(inverse, e)[:k]
+        q = np.convolve(a[::-1][:size], inverse)[:size][::-1]
+        r = a[:len(b) - 1] - np.convolve(q, b)[:len(b) - 1]
+        return (Polynomial(q, self._backend), Polynomial(r, self._backend))
+
+    def __divmod__(self, other: Polynomial) -> tuple[Polynomial, Polynomial]:
         """Divides self by other.
-        
-        Uses synthetic division for linear monic polynomials and long
-        division for the general case."""
+
+        Uses synthetic division for linear monic polynomials, Newton's
+        iteration for long divisors and quotients (see
+        `_NEWTON_DIV_THRESHOLD`) and long division otherwise.
+
+        Returns a pair (quotient, remainder)."""
         if other.is_linear_monic():
             return self.synthetic_division(other)
+        if min(len(other._coeffs),
+               len(self._coeffs) - len(other._coeffs) + 1
+               ) >= _NEWTON_DIV_THRESHOLD:
+            return self.newton_division(other)
         return self.long_division(other)
+
+    def __truediv__(self, other: Polynomial) -> tuple[Polynomial, Polynomial]:
+        """Divides self by other, same as divmod."""
+        return divmod(self, other)
     
     def __floordiv__(self, other: Polynomial) -> Polynomial:
         """Divides self by other and ignores remainder.
@@ -167,23 +322,100 @@ class Polynomial:
     
     def __neg__(self) -> Polynomial:
         """Returns (-self)."""
+        if self._uses_numpy():
+            return Polynomial(-self._coeffs, 'numpy')
         coeffs = list(map(lambda c: -c, self.coeffs))
         return Polynomial(coeffs)
 
-    def eval(self, x0: float) -> float:
-        """Evaluates self using Horner's method.
-        
-        TODO: Check if there is a way to overload the () operator,
-        i.e. use syntax a(5) instead of a.eval(5)."""
-        val = 0.
-        for c in self._coeffs[::-1]:
-            val = c + val * x0
-        return val
-
-    def roots(self, max_steps = 100, eps = 1e-9) -> list[float]:
-        """Finds roots of the polynomial using Newton's method."""
+    def eval(self, x0: float, method: str = 'horner',
+             workers: int | None = None) -> float:
+        """Evaluates self at `x0`.
+
+        Method must be one of "horner", "estrin" or "parallel". "horner" is a
+        sequential loop. "estrin" evaluates with the Estrin scheme (see
+        `_estrin`), whose independent operations are vectorized. "parallel"
+        splits the coefficients into `workers` chunks (by default one per
+        CPU), evaluates them with the Estrin scheme in a thread pool and
+        combines the partial sums."""
+        if method == 'horner':
+            val = 0.
+            for c in self._coeffs[::-1]:
+                val = c + val * x0
+            return val
+        coeffs = np.asarray(self._coeffs, dtype=np.result_type(
+            x0, np.float64))
+        # Powers of a Python int would be exact big ints.
+        x0 = coeffs.dtype.type(x0)
+        if method == 'estrin':
+            return _estrin(coeffs, x0)
+        elif method != 'parallel':
+            raise ValueError("unknown evaluation method")
+        chunks = np.array_split(coeffs, workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(len(chunks)) as executor:
+            partials = list(executor.map(lambda c: _estrin(c, x0), chunks))
+        # Combine the partial sums Horner-style, from the highest chunk. It
+        # seeds the sum, as 0 * x0^n would be nan for an infinite x0^n.
+        val = partials[-1]
+        for chunk, partial in zip(chunks[-2::-1], partials[-2::-1]):
+            val = val * x0 ** len(chunk) + partial
+        return val.item() if isinstance(val, np.generic) else val
+
+    def __call__(self, x: float | np.ndarray,
+                 chunk_size: int | None = None) -> float | np.ndarray:
+        """Evaluates self at a scalar or at every element of an array.
+
+        Arrays are evaluated with a vectorized Horner method, updating a
+        single result buffer in place. With `chunk_size` the input is
+        processed in chunks of that many elements, so that the working set
+        stays small (and in cache) for very large inputs."""
+        if np.isscalar(x):
+            return self.eval(x)
+        x = np.asarray(x)
+        dtype = np.result_type(x, np.float64)
+        if chunk_size is None:
+            return self._horner(x, np.empty(x.shape, dtype=dtype))
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        flat = x.reshape(-1)
+        out = np.empty(len(flat), dtype=dtype)
+        for start in range(0, len(flat), chunk_size):
+            stop = start + chunk_size
+            self._horner(flat[start:stop], out[start:stop])
+        return out.reshape(x.shape)
+
+    def _horner(self, x: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Vectorized Horner method, writing self(x) to `out`."""
+        out.fill(self._coeffs[-1] if len(self._coeffs) else 0)
+        for c in self._coeffs[-2::-1]:
+            out *= x
+            out += c
+        return out
+
+    def roots(self, max_steps = 100, eps = 1e-9, method: str = 'newton',
+              polish: bool = False) -> list[float] | list[complex]:
+        """Finds roots of the polynomial.
+
+        Method must be one of "newton", "aberth" or "companion". "newton"
+        finds real roots one by one with Newton's method, deflating the
+        polynomial after each of them. "aberth" refines all complex roots at
+        once with the Aberth-Ehrlich method (see `_aberth_roots`) and
+        "companion" computes them as eigenvalues of the companion matrix
+        (see `roots_many`). Both return complex numbers, repeated according
+        to their multiplicity. With `polish` they are refined by a few
+        Newton steps against self."""
         if self == 0:
             raise ValueError("Trying to compute roots for 0 polynomial")
+        if method in ('aberth', 'companion'):
+            coeffs = np.asarray(self._coeffs, dtype=np.float64)
+            if method == 'aberth':
+                roots = _aberth_roots(coeffs, max_steps, eps)
+            else:
+                roots = roots_many(coeffs[None, :])[0]
+            if polish:
+                roots = _newton_polish(coeffs, roots)
+            return roots.tolist()
+        elif method != 'newton':
+            raise ValueError("unknown root finding method")
         if self.is_constant():
             return []
         der = self.derivative()
@@ -201,6 +433,102 @@ class Polynomial:
         return [x] + (self / Polynomial([-x, 1]))[0].roots(max_steps, eps)
 
 
+def _estrin(coeffs: np.ndarray, x: float) -> float:
+    """Evaluates the polynomial with `coeffs` at `x` with the Estrin scheme.
+
+    With precomputed powers x^(2^k), level k replaces every pair of
+    neighbouring coefficients (a, b) by a + b * x^(2^k), halving their
+    number. Each level is a single vectorized operation, so evaluation takes
+    O(log n) NumPy calls instead of n dependent steps of the Horner loop.
+
+    If the highest power overflows, although the value may not, falls back
+    to the Horner method."""
+    if not len(coeffs):
+        return 0.
+    powers = [x]
+    with np.errstate(over='ignore'):
+        for _ in range(max(len(coeffs) - 1, 1).bit_length() - 1):
+            powers.append(powers[-1] * powers[-1])
+    if not np.isfinite(powers[-1]):
+        return np.polyval(coeffs[::-1], x).item()
+    for power in powers:
+        if len(coeffs) == 1:
+            break
+        if len(coeffs) % 2:
+            coeffs = np.append(coeffs, 0)
+        coeffs = coeffs[0::2] + coeffs[1::2] * power
+    return coeffs[0].item()
+
+
+def _aberth_roots(
+        coeffs: np.ndarray, max_steps: int, eps: float) -> np.ndarray:
+    """All complex roots of the polynomial with `coeffs`, by the
+    Aberth-Ehrlich method.
+
+    Every step updates all approximations z_k at once by
+    w_k = r_k / (1 - r_k * sum_{j != k} 1 / (z_k - z_j)) with
+    r_k = p(z_k) / p'(z_k), which converges cubically to simple roots. Starts
+    from points spread on a circle of radius given by Fujiwara's bound."""
+    zeros = np.flatnonzero(coeffs)[0]
+    coeffs = coeffs[zeros:] / coeffs[-1]
+    n = len(coeffs) - 1
+    if n == 0:
+        return np.zeros(zeros, dtype=np.complex128)
+    high_first = coeffs[::-1]
+    der_high_first = (coeffs[1:] * np.arange(1, n + 1))[::-1]
+    radius = 2 * max(
+        abs(high_first[k]) ** (1 / k) for k in range(1, n + 1))
+    angles = 2 * np.pi * np.arange(n) / n + 0.4
+    z = radius * np.exp(1j * angles)
+    for _ in range(max_steps):
+        ratio = np.polyval(high_first, z) / np.polyval(der_high_first, z)
+        diff = z[:, None] - z[None, :]
+        np.fill_diagonal(diff, np.inf)
+        w = ratio / (1 - ratio * (1 / diff).sum(axis=1))
+        w[~np.isfinite(w)] = 0
+        z = z - w
+        if np.all(np.abs(w) <= eps * np.maximum(np.abs(z), 1)):
+            break
+    return np.concatenate((np.zeros(zeros, dtype=np.complex128), z))
+
+
+def _newton_polish(
+        coeffs: np.ndarray, roots: np.ndarray, steps: int = 3) -> np.ndarray:
+    """Refines `roots` of the polynomial with `coeffs` by Newton steps."""
+    high_first = coeffs[::-1]
+    der_high_first = (coeffs[1:] * np.arange(1, len(coeffs)))[::-1]
+    for _ in range(steps):
+        der = np.polyval(der_high_first, roots)
+        step = np.polyval(high_first, roots) / np.where(der == 0, 1, der)
+        roots = roots - np.where(der == 0, 0, step)
+    return roots
+
+
+def roots_many(coeffs: np.ndarray) -> np.ndarray:
+    """Roots of many polynomials of the same degree n at once.
+
+    Row i of `coeffs` holds the n + 1 coefficients of the i-th polynomial,
+    lowest first, with a nonzero leading one. Companion matrices of all the
+    polynomials are stacked and their eigenvalues computed with a single
+    `np.linalg.eigvals` call, which avoids per-polynomial Python overhead.
+
+    Returns a complex array of shape (len(coeffs), n)."""
+    coeffs = np.asarray(coeffs, dtype=np.float64)
+    if coeffs.ndim != 2:
+        raise ValueError("coeffs must be a 2-dimensional array")
+    k, n = coeffs.shape[0], coeffs.shape[1] - 1
+    if np.any(coeffs[:, -1] == 0):
+        raise ValueError("leading coefficients must be nonzero")
+    if n <= 0:
+        return np.zeros((k, 0), dtype=np.complex128)
+    # Companion matrix of monic x^n + a_(n-1) x^(n-1) + ... + a_0: ones on
+    # the subdiagonal and -a in the last column.
+    companion = np.zeros((k, n, n))
+    companion[:, np.arange(1, n), np.arange(n - 1)] = 1
+    companion[:, :, -1] = -coeffs[:, :-1] / coeffs[:, -1:]
+    return np.linalg.eigvals(companion).astype(np.complex128)
+
+
 def newton_interpolation(points: list[tuple[float, float]]) -> Polynomial:
     """Newton interpolation of a polynomial.
     
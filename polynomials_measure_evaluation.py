@@ -0,0 +1,63 @@
+"""
+A simple benchmark of single-point evaluation of high-degree polynomials.
+
+For each degree it evaluates a random `Polynomial` (on both coefficient
+backends) and a random `PolynomialModulo` at a single point with every method
+of their `eval` ("horner", "estrin" and "parallel") and reports the best time
+of several repetitions together with the speedup over the Horner loop.
+
+The parallel method only pays off with several CPUs.
+"""
+
+import argparse
+from random import randrange, uniform
+from timeit import repeat
+from polynomials import Polynomial
+from polynomials_modulo import PolynomialModulo
+
+METHODS = ["horner", "estrin", "parallel"]
+
+
+def best_time(f, reps: int) -> float:
+    """Returns the best time (in seconds) of `reps` calls of `f`."""
+    return min(repeat(f, number=1, repeat=reps))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                    prog='Measure polynomial evaluation.')
+    parser.add_argument(
+        "--degrees", type=int, nargs="+", default=[1000, 10000, 100000],
+        help="Degrees of the evaluated polynomials.")
+    parser.add_argument(
+        "--modulus", type=int, default=998244353,
+        help="Modulus of the evaluated PolynomialModulo.")
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Number of threads of the parallel method, one per CPU by "
+             "default.")
+    parser.add_argument(
+        "--reps", type=int, default=5,
+        help="Number of repetitions to take the best time of."
+    )
+    args = parser.parse_args()
+
+    print("class", "degree", *METHODS, "estrin speedup", "parallel speedup",
+          sep="\t")
+    for degree in args.degrees:
+        coeffs = [uniform(-1, 1) for _ in range(degree + 1)]
+        polys = [
+            ("Polynomial/list", Polynomial(coeffs), uniform(-1, 1)),
+            ("Polynomial/numpy", Polynomial(coeffs, 'numpy'), uniform(-1, 1)),
+            ("PolynomialModulo", PolynomialModulo(
+                [randrange(args.modulus) for _ in range(degree + 1)],
+                args.modulus), randrange(args.modulus)),
+        ]
+        for name, poly, x in polys:
+            times = [
+                best_time(lambda: poly.eval(x, method, args.workers),
+                          args.reps)
+                for method in METHODS
+            ]
+            print(name, degree, *["%.2e" % t for t in times],
+                  *["%.1fx" % (times[0] / t) for t in times[1:]], sep="\t")
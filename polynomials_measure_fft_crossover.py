@@ -0,0 +1,68 @@
+"""
+A simple script for finding the crossover between the schoolbook and the FFT
+multiplication of polynomials.
+
+For each size n it multiplies two random polynomials with n coefficients
+using every multiplication method of `Polynomial.multiply` on both coefficient
+backends, and reports the best time of several repetitions together with the
+largest observed error of the FFT product and its a priori bound.
+
+The crossover is the smallest n for which the FFT is faster than the
+schoolbook loop. `polynomials._FFT_MUL_THRESHOLD` should be close to it for
+each backend.
+"""
+
+import argparse
+from random import uniform
+from timeit import repeat
+from polynomials import Polynomial, fft_mul_error_bound
+
+
+def best_time(a: Polynomial, b: Polynomial, method: str, reps: int) -> float:
+    """Returns the best time (in seconds) of `reps` multiplications."""
+    return min(repeat(lambda: a.multiply(b, method), number=1, repeat=reps))
+
+
+def max_error(a: Polynomial, b: Polynomial) -> float:
+    """Largest coefficient difference between the FFT and the schoolbook
+    product."""
+    exact = a.multiply(b, 'schoolbook').coeffs
+    fft = a.multiply(b, 'fft').coeffs
+    fft += [0.] * (len(exact) - len(fft))
+    return max(abs(c1 - c2) for c1, c2 in zip(exact, fft))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                    prog='Measure the FFT multiplication crossover.')
+    parser.add_argument(
+        "--sizes", type=int, nargs="+",
+        default=[4, 8, 16, 32, 64, 128, 256, 512, 1024],
+        help="Numbers of coefficients of the factors.")
+    parser.add_argument(
+        "--reps", type=int, default=5,
+        help="Number of repetitions to take the best time of."
+    )
+    args = parser.parse_args()
+
+    print("n", "list/schoolbook", "list/fft", "numpy/schoolbook",
+          "numpy/fft", "fft error", "error bound", sep="\t")
+    crossover = {}
+    for n in args.sizes:
+        coeffs_a = [uniform(-1, 1) for _ in range(n)]
+        coeffs_b = [uniform(-1, 1) for _ in range(n)]
+        row = [n]
+        for backend in ["list", "numpy"]:
+            a = Polynomial(coeffs_a.copy(), backend)
+            b = Polynomial(coeffs_b.copy(), backend)
+            schoolbook = best_time(a, b, 'schoolbook', args.reps)
+            fft = best_time(a, b, 'fft', args.reps)
+            if fft < schoolbook and backend not in crossover:
+                crossover[backend] = n
+            row += ["%.2e" % schoolbook, "%.2e" % fft]
+        a, b = Polynomial(coeffs_a), Polynomial(coeffs_b)
+        row += ["%.2e" % max_error(a, b), "%.2e" % fft_mul_error_bound(a, b)]
+        print(*row, sep="\t")
+
+    for backend in ["list", "numpy"]:
+        print(f"{backend} crossover:", crossover.get(backend, "not reached"))
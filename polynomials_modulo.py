@@ -8,13 +8,43 @@ protocol in a modulo arithmetic with 32-bit modulus p.
 # class.
 # https://stackoverflow.com/a/42845998
 from __future__ import annotations
-from functools import reduce
-from modulo_division import div_mod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, reduce
+import os
+
+import numpy as np
+
+from modulo_division import inv_mod, inv_mod_batch, mul_mod
+from number_theoretic_transform import ntt_multiply
+
+# Minimal number of coefficients of both factors for which
+# `PolynomialModulo.__mul__` switches to the NTT (for moduli below 2^31).
+_NTT_MUL_THRESHOLD = 64
+
+# Minimal length of both the divisor and the quotient for which
+# `PolynomialModulo.__divmod__` switches to the Newton iteration.
+_NEWTON_DIV_THRESHOLD = 512
+
+# Minimal number of points for which the denominators of Lagrange weights are
+# computed with a multipoint evaluation instead of directly.
+_WEIGHTS_TREE_THRESHOLD = 64
+
+# Maximal number of points (a power of 2) of the subproduct tree nodes at
+# which `_multipoint_eval` stops the reduction and evaluates directly.
+_MULTIPOINT_LEAF_SIZE = 64
+
+# Maximal number of nodes of the Lagrange bases kept by `lagrange_basis`.
+# Every cached basis is a dense n x n array (2 MB at 512 nodes in int64).
+_BASIS_CACHE_MAX_POINTS = 512
+
+# Minimal degree for which `PolynomialModulo.eval_many` evaluates with a
+# subproduct tree instead of the vectorized Horner method.
+_MULTIPOINT_EVAL_THRESHOLD = 2 ** 15
 
 class PolynomialModulo:
     def __init__(self, coeffs: list[int], modulo: int):
         self._modulo = modulo
-        self._coeffs = list(map(lambda c: c % modulo, coeffs))
+        self._coeffs = [c % modulo for c in coeffs]
         while len(self._coeffs) and self._coeffs[-1] == 0:
             self._coeffs.pop()
     
@@ -51,12 +81,79 @@ class PolynomialModulo:
     def __repr__(self) -> str:
         return "PolynomialModulo(%s, %d)" % (str(self._coeffs), self.modulus)
 
-    def eval(self, x):
-        """Evaluates self at `x`, using Horner method."""
-        return reduce(
-          lambda acc, coeff: (acc * x + coeff) % self._modulo,
-          self._coeffs[::-1],
-          0)
+    def derivative(self) -> PolynomialModulo:
+        """Returns a derivative of self."""
+        return PolynomialModulo(
+            [c * (i + 1) for i, c in enumerate(self._coeffs[1:])],
+            self._modulo
+        )
+
+    def eval(self, x, method: str = 'horner', workers: int | None = None):
+        """Evaluates self at `x`.
+
+        Method must be one of "horner", "estrin" or "parallel". "horner" is a
+        sequential loop. "estrin" evaluates with the Estrin scheme (see
+        `_estrin_mod`). "parallel" splits the coefficients into `workers`
+        chunks (by default one per CPU), evaluates them with the Estrin
+        scheme in a thread pool and combines the partial sums."""
+        m = self._modulo
+        if method == 'horner':
+            return reduce(
+              lambda acc, coeff: (acc * x + coeff) % m,
+              self._coeffs[::-1],
+              0)
+        if method == 'estrin':
+            return _estrin_mod(self._coeffs, x, m)
+        elif method != 'parallel':
+            raise ValueError("unknown evaluation method")
+        workers = workers or os.cpu_count() or 1
+        size = -(-len(self._coeffs) // workers)
+        starts = range(0, len(self._coeffs), max(size, 1))
+        with ThreadPoolExecutor(workers) as executor:
+            partials = executor.map(
+                lambda s: _estrin_mod(self._coeffs[s:s + size], x, m), starts)
+            return sum(
+                partial * pow(x, s, m)
+                for s, partial in zip(starts, partials)) % m
+
+    def eval_many(self, xs: list[int] | np.ndarray,
+                  method: str = 'auto') -> list[int] | np.ndarray:
+        """Evaluates self at all `xs`.
+
+        Method must be one of "auto", "horner" or "subproduct_tree".
+        "horner" runs the Horner method on all xs at once, in an int64 array
+        for moduli below 2^31 and in an array of Python ints otherwise.
+        "subproduct_tree" reduces self modulo subproduct trees of chunks of
+        deg + 1 xs, which with NTT multiplication and Newton division costs
+        O(n log^2 n) per chunk for moduli below 2^31. "auto" uses the
+        subproduct tree for polynomials of degree at least
+        `_MULTIPOINT_EVAL_THRESHOLD`.
+
+        Returns an ndarray if `xs` is one and a list otherwise."""
+        m = self._modulo
+        if m < 2 ** 31:
+            values = (np.asarray(xs) % m).astype(np.int64)
+        else:
+            # Python ints, as numpy integers would overflow in the products.
+            values = np.array([int(x) % m for x in xs], dtype=object)
+        if method == 'auto':
+            method = 'subproduct_tree' if (
+                self.degree >= _MULTIPOINT_EVAL_THRESHOLD) else 'horner'
+        if method == 'horner':
+            result = np.zeros(len(values), dtype=values.dtype)
+            for c in self._coeffs[::-1]:
+                result = (result * values + c) % m
+        elif method == 'subproduct_tree':
+            chunk = self.degree + 1
+            result = []
+            for start in range(0, len(values), chunk):
+                tree = _subproduct_tree(
+                    values[start:start + chunk].tolist(), m)
+                result += _multipoint_eval(self, tree)
+            result = np.array(result, dtype=values.dtype)
+        else:
+            raise ValueError("unknown evaluation method")
+        return result if isinstance(xs, np.ndarray) else result.tolist()
     
     def __eq__(self, value: object) -> bool:
         if isinstance(value, PolynomialModulo):
@@ -91,38 +188,393 @@ class PolynomialModulo:
         if self.modulus != other.modulus:
             raise ValueError("Both arguments of * operation must have the \
                              same modulus")
-        coeffs = [0 for _ in range(len(self._coeffs) + len(other.coeffs))]
-        for i, c1 in enumerate(self._coeffs):
-            for j, c2 in enumerate(other.coeffs):
-                coeffs[i + j] += c1 * c2 % self._modulo
-                coeffs[i + j] %= self._modulo
-        return PolynomialModulo(coeffs, self._modulo)
-        
+        if (min(len(self._coeffs), len(other.coeffs)) >= _NTT_MUL_THRESHOLD
+                and self._modulo < 2 ** 31):
+            return PolynomialModulo(
+                ntt_multiply(self._coeffs, other.coeffs, self._modulo),
+                self._modulo
+            )
+        m = self._modulo
+        if not self._coeffs or not other.coeffs:
+            return PolynomialModulo([], m)
+        small = min(len(self._coeffs), len(other.coeffs)) <= 2 ** 16
+        dtype = np.int64 if m < 2 ** 31 and small else object
+        coeffs = mul_mod(np.array(self._coeffs, dtype=dtype),
+                         np.array(other.coeffs, dtype=dtype), m, np.convolve)
+        return PolynomialModulo(coeffs.tolist(), m)
+
+
+    def __divmod__(self, other: PolynomialModulo
+                   ) -> tuple[PolynomialModulo, PolynomialModulo]:
+        """Divides self by `other`, whose leading coefficient must be
+        invertible modulo m.
+
+        Short quotients or divisors use a vectorized long division. Otherwise
+        the reversed quotient is rev(self) / rev(other) mod x^(n - k + 1),
+        with the inverse series from Newton's iteration (see
+        `_series_inverse`), which costs O(M(n)) for M(n) the cost of a
+        multiplication.
+
+        Returns a pair (quotient, remainder)."""
+        if self.modulus != other.modulus:
+            raise ValueError("Both arguments of divmod must have the \
+                             same modulus")
+        if other == 0:
+            raise ValueError("The divisor must be non zero.")
+        if len(self._coeffs) < len(other.coeffs):
+            return PolynomialModulo([], self._modulo), self
+        if min(len(other.coeffs), len(self._coeffs) - len(other.coeffs) + 1
+               ) >= _NEWTON_DIV_THRESHOLD:
+            return _newton_divmod(self, other)
+        return _long_divmod(self, other)
+
+    def __floordiv__(self, other: PolynomialModulo) -> PolynomialModulo:
+        """Quotient of the division of self by `other` (see `__divmod__`)."""
+        return divmod(self, other)[0]
+
+    def __mod__(self, other: PolynomialModulo) -> PolynomialModulo:
+        """Remainder of the division of self by `other` (see
+        `__divmod__`)."""
+        return divmod(self, other)[1]
+
+def _estrin_mod(coeffs: list[int], x: int, m: int) -> int:
+    """Evaluates the polynomial with `coeffs` at `x` modulo `m` with the
+    Estrin scheme.
+
+    With precomputed powers x^(2^k), level k replaces every pair of
+    neighbouring coefficients (a, b) by a + b * x^(2^k), as a single
+    vectorized operation, in int64 for moduli below 2^31 and in Python ints
+    otherwise."""
+    if not len(coeffs):
+        return 0
+    c = np.array(coeffs, dtype=np.int64 if m < 2 ** 31 else object) % m
+    powers = [x % m]
+    for _ in range(max(len(c) - 1, 1).bit_length() - 1):
+        powers.append(powers[-1] * powers[-1] % m)
+    for power in powers:
+        if len(c) == 1:
+            break
+        if len(c) % 2:
+            c = np.append(c, np.zeros(1, dtype=c.dtype))
+        c = (c[0::2] + c[1::2] * power) % m
+    return int(c[0])
+
+
+def _long_divmod(
+        a: PolynomialModulo, b: PolynomialModulo
+) -> tuple[PolynomialModulo, PolynomialModulo]:
+    """Quotient and remainder of the division of `a` by `b`.
+
+    Classical long division, with one vectorized row update per quotient
+    term. The leading coefficient of `b` must be invertible modulo m."""
+    m = a.modulus
+    dtype = np.int64 if m < 2 ** 31 else object
+    r = np.array(a.coeffs, dtype=dtype)
+    d = np.array(b.coeffs, dtype=dtype)
+    q = np.zeros(len(r) - len(d) + 1, dtype=dtype)
+    lead_inv = inv_mod(int(d[-1]), m)
+    for top in range(len(r) - 1, len(d) - 2, -1):
+        c = r[top] * lead_inv % m
+        if c:
+            start = top - len(d) + 1
+            q[start] = c
+            r[start:top + 1] = (r[start:top + 1] - d * c % m) % m
+    return (PolynomialModulo(q.tolist(), m),
+            PolynomialModulo(r[:len(d) - 1].tolist(), m))
+
+
+def _series_inverse(f: PolynomialModulo, n: int) -> PolynomialModulo:
+    """Inverse of the power series `f` modulo x^n.
+
+    Newton's iteration g <- g (2 - f g) doubles the number of correct
+    coefficients of g = 1 / f in every step. The constant term of `f` must be
+    invertible modulo m."""
+    m = f.modulus
+    coeffs = f.coeffs
+    g = PolynomialModulo([inv_mod(coeffs[0], m)], m)
+    k = 1
+    while k < n:
+        k = min(2 * k, n)
+        fg = (PolynomialModulo(coeffs[:k], m) * g).coeffs[:k]
+        e = [-c for c in fg] + [0 for _ in range(k - len(fg))]
+        e[0] += 2
+        g = PolynomialModulo((g * PolynomialModulo(e, m)).coeffs[:k], m)
+    return g
+
+
+def _newton_divmod(
+        a: PolynomialModulo, b: PolynomialModulo
+) -> tuple[PolynomialModulo, PolynomialModulo]:
+    """Quotient and remainder of the division of `a` by `b`, through the
+    inverse series of the reversed divisor."""
+    m = a.modulus
+    n, k = a.degree + 1, b.degree + 1
+    size = n - k + 1
+    inverse = _series_inverse(PolynomialModulo(b.coeffs[::-1], m), size)
+    rev_q = (PolynomialModulo(a.coeffs[::-1][:size], m) * inverse).coeffs
+    rev_q = rev_q[:size] + [0 for _ in range(size - len(rev_q))]
+    q = PolynomialModulo(rev_q[::-1], m)
+    qb = (q * b).coeffs
+    r = [
+        c - (qb[i] if i < len(qb) else 0)
+        for i, c in enumerate(a.coeffs[:k - 1])
+    ]
+    return q, PolynomialModulo(r, m)
+
+
+def _subproduct_tree(
+        xs: list[int], m: int) -> list[list[PolynomialModulo]]:
+    """Builds the subproduct tree of (x - x_i) for all `xs`.
+
+    Returns the levels of the tree from the leaves to the root. The i-th node
+    of a level is the product of nodes 2i and 2i + 1 of the level below (or
+    just node 2i, if there is no node 2i + 1)."""
+    levels = [[PolynomialModulo([-x, 1], m) for x in xs]]
+    while len(levels[-1]) > 1:
+        below = levels[-1]
+        levels.append([
+            below[i] * below[i + 1] if i + 1 < len(below) else below[i]
+            for i in range(0, len(below), 2)
+        ])
+    return levels
+
+
+def _multipoint_eval(
+        poly: PolynomialModulo,
+        tree: list[list[PolynomialModulo]]) -> list[int]:
+    """Evaluates `poly` at all leaves of the subproduct `tree` by reducing it
+    modulo the nodes on the way down.
+
+    Below nodes of at most `_MULTIPOINT_LEAF_SIZE` points the remainders are
+    evaluated at their points with the vectorized Horner method instead."""
+    m = poly.modulus
+    xs = [-leaf.coeffs[0] % m for leaf in tree[0]]
+    stop = min(_MULTIPOINT_LEAF_SIZE.bit_length() - 1, len(tree) - 1)
+    rems = [poly % tree[-1][0]]
+    for j in range(len(tree) - 2, stop - 1, -1):
+        rems = [rems[i // 2] % node for i, node in enumerate(tree[j])]
+    size = 2 ** stop
+    values = []
+    for i, r in enumerate(rems):
+        values += r.eval_many(xs[i * size:(i + 1) * size], 'horner')
+    return values
+
+
+def _subproduct_tree_interpolation(
+        xs: list[int], ys: list[int], m: int) -> PolynomialModulo:
+    """Lagrange interpolation using a subproduct tree.
+
+    With M = (x - x_0)...(x - x_n), the Lagrange weights are y_i / M'(x_i).
+    M'(x_i) are computed with a multipoint evaluation and inverted in a
+    single batch, then the weighted sum of M / (x - x_i) is assembled going
+    up the tree. With NTT multiplication and Newton division this takes
+    O(n log^2 n) operations for moduli below 2^31."""
+    tree = _subproduct_tree(xs, m)
+    inverses = inv_mod_batch(_multipoint_eval(tree[-1][0].derivative(), tree), m)
+    sums = [
+        PolynomialModulo([y * inv], m) for y, inv in zip(ys, inverses)
+    ]
+    for level in tree[:-1]:
+        sums = [
+            sums[i] * level[i + 1] + sums[i + 1] * level[i]
+            if i + 1 < len(level) else sums[i]
+            for i in range(0, len(level), 2)
+        ]
+    return sums[0]
+
+
+@lru_cache(maxsize=128)
+def lagrange_weights_at_zero(xs: tuple[int, ...], m: int) -> tuple[int, ...]:
+    """Values of the Lagrange basis polynomials for nodes `xs` at x = 0.
+
+    The polynomial going through points (x_i, y_i) takes value
+    sum(w_i * y_i) at 0. The weights are
+    w_i = prod_{j != i} x_j / (x_j - x_i); numerators come from prefix and
+    suffix products and all denominators are inverted in a single batch.
+    Results are cached, so `xs` must be a tuple."""
+    k = len(xs)
+    negated = [-x % m for x in xs]
+    suffix = [1 for _ in range(k + 1)]
+    for i in range(k - 1, -1, -1):
+        suffix[i] = suffix[i + 1] * negated[i] % m
+    numerators = []
+    prefix = 1
+    for i in range(k):
+        numerators.append(prefix * suffix[i + 1] % m)
+        prefix = prefix * negated[i] % m
+    # The denominators are prod_{j != i} (x_i - x_j) = M'(x_i).
+    if k > _WEIGHTS_TREE_THRESHOLD:
+        tree = _subproduct_tree(list(xs), m)
+        denominators = _multipoint_eval(tree[-1][0].derivative(), tree)
+    else:
+        denominators = []
+        for i in range(k):
+            denominator = 1
+            for j in range(k):
+                if i != j:
+                    denominator = denominator * (xs[i] - xs[j]) % m
+            denominators.append(denominator)
+    return tuple(
+        n * inv % m
+        for n, inv in zip(numerators, inv_mod_batch(denominators, m))
+    )
+
+
+def _master_polynomial(nodes: np.ndarray, m: int) -> np.ndarray:
+    """Coefficients of M = prod_j (x - x_j) for `nodes` reduced modulo m."""
+    master = np.zeros(len(nodes) + 1, dtype=nodes.dtype)
+    master[0] = 1
+    for i, x in enumerate(nodes.tolist()):
+        master[1:i + 2] = (master[:i + 1] - x * master[1:i + 2]) % m
+        master[0] = -x * master[0] % m
+    return master
+
+
+def _lagrange_basis(xs: tuple[int, ...], m: int) -> np.ndarray:
+    """Uncached `lagrange_basis`."""
+    k = len(xs)
+    dtype = np.int64 if m < 2 ** 31 else object
+    nodes = np.array([x % m for x in xs], dtype=dtype)
+    master = _master_polynomial(nodes, m)
+    # Synthetic division of M by (x - x_i), one column of quotients at a time.
+    quotients = np.zeros((k, k), dtype=dtype)
+    column = np.zeros(k, dtype=dtype)
+    for j in range(k, 0, -1):
+        column = (master[j] + nodes * column) % m
+        quotients[:, j - 1] = column
+    # M'(x_i) is the quotient of M by (x - x_i) evaluated at x_i.
+    derivatives = np.zeros(k, dtype=dtype)
+    for j in range(k - 1, -1, -1):
+        derivatives = (derivatives * nodes + quotients[:, j]) % m
+    inverses = np.array(
+        inv_mod_batch(derivatives.tolist(), m), dtype=dtype)
+    return quotients * inverses[:, None] % m
+
+
+@lru_cache(maxsize=32)
+def _cached_lagrange_basis(xs: tuple[int, ...], m: int) -> np.ndarray:
+    basis = _lagrange_basis(xs, m)
+    basis.flags.writeable = False
+    return basis
+
+
+def lagrange_basis(xs: tuple[int, ...], m: int) -> np.ndarray:
+    """Coefficients of the Lagrange basis polynomials for nodes `xs`.
+
+    Row i holds the coefficients of L_i = prod_{j != i} (x - x_j) / (x_i - x_j).
+    With M = prod_j (x - x_j), the numerators are M / (x - x_i), computed for
+    all i at once by a vectorized synthetic division, and the denominators
+    are M'(x_i), inverted in a single batch. This costs O(n^2) operations.
+
+    Bases of at most `_BASIS_CACHE_MAX_POINTS` nodes are cached (see
+    `_cached_lagrange_basis.cache_info()` for hit and miss counters) and
+    returned read-only, so `xs` must be a tuple."""
+    if len(xs) > _BASIS_CACHE_MAX_POINTS:
+        return _lagrange_basis(xs, m)
+    return _cached_lagrange_basis(xs, m)
+
+
+def _lagrange_combination(xs: list[int], ys: list[int], m: int) -> list[int]:
+    """Coefficients of sum(y_i * L_i) for the Lagrange basis polynomials L_i
+    of nodes `xs`.
+
+    The same synthetic division as in `lagrange_basis`, but each column of
+    quotients is combined with the weights y_i / M'(x_i) as soon as it is
+    computed, so only O(n) memory is used. The columns are computed twice:
+    once for M'(x_i) and once for the combination."""
+    k = len(xs)
+    dtype = np.int64 if m < 2 ** 31 else object
+    nodes = np.array([x % m for x in xs], dtype=dtype)
+    master = _master_polynomial(nodes, m)
+    # The columns come from the highest degree, so M'(x_i) follows by Horner.
+    column = np.zeros(k, dtype=dtype)
+    derivatives = np.zeros(k, dtype=dtype)
+    for j in range(k, 0, -1):
+        column = (master[j] + nodes * column) % m
+        derivatives = (derivatives * nodes + column) % m
+    weights = np.array([
+        y * inv % m
+        for y, inv in zip(ys, inv_mod_batch(derivatives.tolist(), m))
+    ], dtype=dtype)
+    coeffs = [0 for _ in range(k)]
+    column = np.zeros(k, dtype=dtype)
+    for j in range(k, 0, -1):
+        column = (master[j] + nodes * column) % m
+        coeffs[j - 1] = int((weights * column % m).sum() % m)
+    return coeffs
+
 
 def lagrange_interpolation(
-        points: list[tuple[int, int]], m: int) -> PolynomialModulo:
+        points: list[tuple[int, int]] | np.ndarray, m: int,
+        method: str = 'direct') -> PolynomialModulo:
     """Lagrange interpolation of a polynomial in modular arithmetic modulo `m`.
 
     Returns a polynomial of degree n going through all n+1 provided points.
 
-    Points must be in format [x, y]."""
-    points = sorted(points)
-    xs, _ = zip(*points)
+    Method must be either "direct" or "subproduct_tree". The direct method
+    combines the Lagrange basis polynomials from `lagrange_basis`, which are
+    cached per set of xs, so repeated interpolations over the same xs cost a
+    single vector-matrix product. Above `_BASIS_CACHE_MAX_POINTS` points it
+    combines them column by column instead, in O(n) memory. The subproduct
+    tree needs no O(n^2) operations, which pays off for thousands of
+    points.
+
+    Points must be in format [x, y]: either a list of pairs or an array of
+    shape (n + 1, 2)."""
+    if isinstance(points, np.ndarray):
+        points = points[np.argsort(points[:, 0], kind='stable')]
+        xs, ys = points[:, 0].tolist(), points[:, 1].tolist()
+    else:
+        points = sorted(points)
+        xs, ys = zip(*points)
     if len(set(xs)) != len(xs):
         raise ValueError("xs must be unique")
-    
-    lagrange = PolynomialModulo([], m)
-
-    for i in range(len(points)):
-        denominator = 1
-        numerator = PolynomialModulo([1], m)
-        for j in range(len(points)):
-            if i != j:
-                numerator *= PolynomialModulo([-points[j][0], 1], m)
-                denominator *= (points[i][0] - points[j][0]) % m
-        lagrange += numerator * div_mod(points[i][1], denominator, m)
-
-    return lagrange
+    if method == 'subproduct_tree':
+        return _subproduct_tree_interpolation(list(xs), list(ys), m)
+    elif method != 'direct':
+        raise ValueError("unknown interpolation method")
+
+    if len(xs) > _BASIS_CACHE_MAX_POINTS:
+        return PolynomialModulo(
+            _lagrange_combination(list(xs), list(ys), m), m)
+    basis = lagrange_basis(tuple(x % m for x in xs), m)
+    ys = np.array([y % m for y in ys], dtype=basis.dtype)
+    return PolynomialModulo(mul_mod(ys, basis, m).tolist(), m)
+
+
+def berlekamp_massey(seq: list[int] | np.ndarray, m: int) -> PolynomialModulo:
+    """Minimal polynomial of a linearly recurrent sequence modulo prime `m`.
+
+    Returns the monic polynomial x^L + c_1 x^(L-1) + ... + c_L of the
+    shortest recurrence s_n + c_1 s_(n-1) + ... + c_L s_(n-L) = 0 that
+    generates `seq`. A sequence of length 2L determines it uniquely.
+
+    The discrepancies and updates are done on NumPy arrays, in int64 for
+    moduli below 2^31 and in Python ints otherwise."""
+    dtype = np.int64 if m < 2 ** 31 else object
+    s = np.array([x % m for x in seq], dtype=dtype)
+    n = len(s)
+    # Connection polynomials 1 + c_1 x + ... of the current and the last
+    # shorter recurrence.
+    c = np.zeros(n + 1, dtype=dtype)
+    b = np.zeros(n + 1, dtype=dtype)
+    c[0] = b[0] = 1
+    length, shift, last = 0, 1, 1
+    for i in range(n):
+        d = (s[i] + (c[1:length + 1] * s[i - length:i][::-1] % m).sum()) % m
+        if d == 0:
+            shift += 1
+            continue
+        coef = int(d) * inv_mod(last, m) % m
+        update = b[:n + 1 - shift] * coef % m
+        if 2 * length <= i:
+            t = c.copy()
+            c[shift:] = (c[shift:] - update) % m
+            length, b, last, shift = i + 1 - length, t, int(d), 1
+        else:
+            c[shift:] = (c[shift:] - update) % m
+            shift += 1
+    return PolynomialModulo(c[:length + 1][::-1].tolist(), m)
 
 if __name__ == '__main__':
     pass
\ No newline at end of file
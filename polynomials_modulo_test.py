@@ -1,5 +1,9 @@
 import unittest
-from polynomials_modulo import PolynomialModulo, lagrange_interpolation
+from unittest import mock
+import numpy as np
+from polynomials_modulo import (
+    PolynomialModulo, _BASIS_CACHE_MAX_POINTS, _cached_lagrange_basis,
+    berlekamp_massey, lagrange_basis, lagrange_interpolation)
 
 class PolynomialModuloTest(unittest.TestCase):
 
@@ -25,6 +29,50 @@ class PolynomialModuloTest(unittest.TestCase):
              + PolynomialModulo([2, 4, -9, -5, 4], 10)),
              PolynomialModulo([2, 7, 0, -6, 4], 10))
     
+    def test_mul(self):
+        self.assertEqual(
+            PolynomialModulo([1, 2], 7) * PolynomialModulo([3, 4], 7),
+            PolynomialModulo([3, 10, 8], 7)
+        )
+        self.assertEqual(
+            PolynomialModulo([1, 2], 7) * 4, PolynomialModulo([4, 1], 7))
+
+    def test_mul_large(self):
+        m = 1000000007
+        a = PolynomialModulo([(i * 7919) % m for i in range(200)], m)
+        b = PolynomialModulo([(i * i + 1) % m for i in range(150)], m)
+        expected = [0 for _ in range(349)]
+        for i, x in enumerate(a.coeffs):
+            for j, y in enumerate(b.coeffs):
+                expected[i + j] = (expected[i + j] + x * y) % m
+        self.assertEqual(a * b, PolynomialModulo(expected, m))
+
+    def test_eval_many(self):
+        for m in [251, 1000000007, 2 ** 89 - 1]:
+            with self.subTest(m):
+                poly = PolynomialModulo(
+                    [(i * 7919 + 3) % m for i in range(40)], m)
+                xs = list(range(-5, 300)) + [2 ** 70 + 1]
+                expected = [poly.eval(x) for x in xs]
+                self.assertEqual(poly.eval_many(xs), expected)
+                self.assertEqual(
+                    poly.eval_many(xs, 'subproduct_tree'), expected)
+        self.assertEqual(
+            PolynomialModulo([1, 2], 7).eval_many(np.array([3, 4])).tolist(),
+            [0, 2]
+        )
+        self.assertEqual(PolynomialModulo([], 7).eval_many([1, 2]), [0, 0])
+        for m in [2 ** 61 - 1, 2 ** 64 - 59]:
+            with self.subTest(m):
+                poly = PolynomialModulo([m - 1 - i for i in range(10)], m)
+                xs = np.arange(2 ** 40, 2 ** 40 + 20, dtype=np.int64)
+                expected = [poly.eval(int(x)) for x in xs]
+                for method in ['horner', 'subproduct_tree']:
+                    self.assertEqual(
+                        poly.eval_many(xs, method).tolist(), expected)
+        with self.assertRaises(ValueError):
+            PolynomialModulo([1, 2], 7).eval_many([1], 'estrin')
+
     def test_interpolation(self):
         # From https://math.stackexchange.com/questions/621406/lagrange-interpolating-polynomial-using-modulo
         self.assertEqual(
@@ -35,5 +83,121 @@ class PolynomialModuloTest(unittest.TestCase):
             PolynomialModulo([100, 0, 100], 251)
         )
 
+    def test_derivative(self):
+        self.assertEqual(
+            PolynomialModulo([4, 8, 9, 3], 7).derivative(),
+            PolynomialModulo([1, 4, 2], 7)
+        )
+
+    def test_lagrange_basis(self):
+        basis = lagrange_basis((1, 2, 3), 251)
+        for i, x in enumerate([1, 2, 3]):
+            poly = PolynomialModulo(basis[i].tolist(), 251)
+            self.assertEqual(
+                [poly.eval(x0) for x0 in [1, 2, 3]],
+                [int(x0 == x) for x0 in [1, 2, 3]])
+        with self.assertRaises(ValueError):
+            basis[0, 0] = 1
+
+    def test_interpolation_caches_basis(self):
+        _cached_lagrange_basis.cache_clear()
+        m = 2 ** 61 - 1
+        for secret in range(5):
+            points = [(3, secret), (1, 2 * secret), (2, 7)]
+            poly = lagrange_interpolation(points, m)
+            self.assertEqual([poly.eval(x) for x, _ in points],
+                             [y for _, y in points])
+        info = _cached_lagrange_basis.cache_info()
+        self.assertEqual((info.hits, info.misses), (4, 1))
+
+    def test_interpolation_without_cached_basis(self):
+        _cached_lagrange_basis.cache_clear()
+        k = _BASIS_CACHE_MAX_POINTS + 1
+        for m in [1000000007, 2 ** 61 - 1]:
+            with self.subTest(m):
+                points = [(x, (x * x * 31 + 7) % m) for x in range(-9, k - 9)]
+                poly = lagrange_interpolation(points, m)
+                self.assertEqual(poly, PolynomialModulo([7, 0, 31], m))
+                basis = lagrange_basis(tuple(x for x, _ in points), m)
+                self.assertTrue(basis.flags.writeable)
+        self.assertEqual(_cached_lagrange_basis.cache_info().currsize, 0)
+
+    def test_subproduct_tree_interpolation(self):
+        self.assertEqual(
+            lagrange_interpolation(
+                [(1, 200), (2, 500), (3, 1000)],
+                251,
+                'subproduct_tree'
+            ),
+            PolynomialModulo([100, 0, 100], 251)
+        )
+        m = 1000000007
+        points = [(x, (x * x * 31 + 7) % m) for x in range(-50, 250, 3)]
+        self.assertEqual(
+            lagrange_interpolation(points, m, 'subproduct_tree'),
+            lagrange_interpolation(points, m)
+        )
+        with self.assertRaises(ValueError):
+            lagrange_interpolation(points, m, 'newton')
+
+    def test_eval_methods(self):
+        for m in [13, 998244353, 2 ** 89 - 1]:
+            p = PolynomialModulo([(i * i + 7) % m for i in range(1001)], m)
+            for x in [0, 5, m - 1, 2 ** 70]:
+                expected = p.eval(x)
+                for method in ['estrin', 'parallel']:
+                    with self.subTest(m=m, x=x, method=method):
+                        self.assertEqual(
+                            p.eval(x, method, workers=3), expected)
+        self.assertEqual(PolynomialModulo([], 7).eval(3, 'estrin'), 0)
+        with mock.patch('os.cpu_count', return_value=None):
+            self.assertEqual(
+                PolynomialModulo([1, 2], 7).eval(3, 'parallel'), 0)
+        with self.assertRaises(ValueError):
+            PolynomialModulo([1, 2], 7).eval(3, 'clenshaw')
+
+    def test_divmod(self):
+        a = PolynomialModulo([-42, 0, -12, 1], 13)
+        b = PolynomialModulo([-3, 1, 1], 13)
+        self.assertEqual(divmod(a, b), (
+            PolynomialModulo([-13, 1], 13), PolynomialModulo([-81, 16], 13)))
+        self.assertEqual(a // b, PolynomialModulo([-13, 1], 13))
+        self.assertEqual(a % b, PolynomialModulo([-81, 16], 13))
+        self.assertEqual(divmod(b, a), (PolynomialModulo([], 13), b))
+        with self.assertRaises(ValueError):
+            divmod(a, PolynomialModulo([13], 13))
+        with self.assertRaises(ValueError):
+            divmod(a, PolynomialModulo([1, 1], 7))
+
+    def test_divmod_newton(self):
+        rng = np.random.default_rng(5)
+        for m in [998244353, 10 ** 9 + 7, 2 ** 61 - 1]:
+            for n, k in [(1500, 600), (600, 1500), (2000, 1)]:
+                with self.subTest(m=m, n=n, k=k):
+                    a = PolynomialModulo(
+                        [int(c) for c in rng.integers(0, 2 ** 31, n + k)], m)
+                    b = PolynomialModulo(
+                        [int(c) for c in rng.integers(0, 2 ** 31, k)] + [3],
+                        m)
+                    q, r = divmod(a, b)
+                    self.assertLess(r.degree, b.degree)
+                    self.assertEqual(q * b + r, a)
+
+    def test_berlekamp_massey(self):
+        fibonacci = [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
+        self.assertEqual(
+            berlekamp_massey(fibonacci, 101),
+            PolynomialModulo([-1, -1, 1], 101))
+        self.assertEqual(
+            berlekamp_massey([1, 2, 4, 8], 7), PolynomialModulo([-2, 1], 7))
+        self.assertEqual(berlekamp_massey([0, 0, 0], 7), 1)
+        # Moduli beyond int64 use Python ints.
+        m = 2 ** 61 - 1
+        seq = [3, 5]
+        for _ in range(10):
+            seq.append((7 * seq[-1] + 11 * seq[-2]) % m)
+        self.assertEqual(
+            berlekamp_massey(seq, m), PolynomialModulo([-11, -7, 1], m))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
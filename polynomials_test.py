@@ -1,6 +1,9 @@
 import unittest
+from unittest import mock
 import math
-from polynomials import Polynomial, interpolate, newton_interpolation
+from polynomials import (
+    Polynomial, interpolate, newton_interpolation, fft_mul_error_bound,
+    roots_many, _EQ_EPS)
 import numpy as np
 
 class TestPolynomials(unittest.TestCase):
@@ -87,6 +90,25 @@ class TestPolynomials(unittest.TestCase):
         self.assertEqual(Polynomial([1, 2, 3]) * Polynomial([]), Polynomial([]))
         self.assertEqual(Polynomial([1, 1, 1, 1]) * Polynomial([1, 1, 1, 1]), Polynomial([1, 2, 3, 4, 3, 2, 1]))
     
+    def test_fft_mul(self):
+        a = Polynomial([(-1) ** i * (i % 7) for i in range(300)])
+        b = Polynomial([(i * i) % 11 - 5 for i in range(200)])
+        exact = a.multiply(b, 'schoolbook').coeffs
+        for backend in ['list', 'numpy']:
+            with self.subTest(backend):
+                fft = Polynomial(a.coeffs, backend).multiply(
+                    Polynomial(b.coeffs, backend), 'fft')
+                self.assertEqual(fft.backend, backend)
+                self.assertLessEqual(
+                    max(abs(c1 - c2) for c1, c2 in zip(exact, fft.coeffs)),
+                    fft_mul_error_bound(a, b))
+        self.assertEqual(a * b, a.multiply(b, 'schoolbook'))
+        self.assertEqual(
+            Polynomial([1, 1]).multiply(Polynomial([-1, 1]), 'fft'),
+            Polynomial([-1, 0, 1]))
+        with self.assertRaises(ValueError):
+            a.multiply(b, 'karatsuba')
+
     def test_long_division(self):
         self.assertEqual(
             Polynomial([-4, 0, -2, 1]).long_division(Polynomial([-3, 1])),
@@ -105,6 +127,45 @@ class TestPolynomials(unittest.TestCase):
         with self.assertRaises(ValueError):
             Polynomial([5, 4, 1]).long_division(Polynomial([]))
     
+    def test_long_division_cancels_leading_terms(self):
+        rng = np.random.default_rng(3)
+        a = Polynomial(rng.uniform(-1, 1, 100))
+        b = Polynomial(list(rng.uniform(-1, 1, 49)) + [1.5])
+        q, r = a.long_division(b)
+        self.assertEqual((q.degree, r.degree), (50, 48))
+
+    def test_newton_division(self):
+        rng = np.random.default_rng(4)
+        for backend in ['list', 'numpy']:
+            for n, k in [(3, 5), (10, 1), (40, 17), (3000, 1000)]:
+                with self.subTest(backend=backend, n=n, k=k):
+                    # Divisors with a dominant constant term keep the
+                    # inverse series (and the quotient) well-conditioned.
+                    a = Polynomial(rng.uniform(-1, 1, n), backend)
+                    b = Polynomial(
+                        [4.] + list(rng.uniform(-1, 1, k - 1) / k) + [1.],
+                        backend)
+                    q, r = a.newton_division(b)
+                    self.assertEqual((q, r), a.long_division(b))
+                    self.assertEqual(divmod(a, b), (q, r))
+                    self.assertEqual(q.backend, backend)
+        # Generic monic divisors, whose quotients span many orders of
+        # magnitude.
+        for n, k in [(600, 20), (1000, 300), (1200, 600), (2000, 1000)]:
+            with self.subTest(n=n, k=k):
+                a = Polynomial(rng.uniform(-1, 1, n), 'numpy')
+                b = Polynomial(
+                    list(rng.uniform(-1, 1, k - 1)) + [1.], 'numpy')
+                q, r = a.newton_division(b)
+                expected_q, expected_r = a.long_division(b)
+                for x, y in [(q, expected_q), (r, expected_r)]:
+                    x, y = np.asarray(x.coeffs), np.asarray(y.coeffs)
+                    self.assertLess(
+                        np.abs(x - y).max(), 1e-12 * np.abs(y).max())
+                self.assertAlmostEqual(q.coeffs[-1], a.coeffs[-1])
+        with self.assertRaises(ValueError):
+            Polynomial([5, 4, 1]).newton_division(Polynomial([]))
+
     def test_short_division(self):
         self.assertEqual(
             Polynomial([-42, 0, -12, 1]).synthetic_division(Polynomial([-3, 1])),
@@ -157,6 +218,51 @@ class TestPolynomials(unittest.TestCase):
             5 + 9 * 17 - 1 * 17**2 + 8 * 17 ** 3 + 4 * 17 ** 4
         )
     
+    def test_eval_methods(self):
+        coeffs = np.random.default_rng(2).uniform(-1, 1, 1001)
+        for backend in ['list', 'numpy']:
+            p = Polynomial(coeffs, backend)
+            for x in [0., 0.9, -1.01, 0.5j]:
+                expected = p.eval(x)
+                for method in ['estrin', 'parallel']:
+                    with self.subTest(backend=backend, x=x, method=method):
+                        np.testing.assert_allclose(
+                            p.eval(x, method, workers=3), expected)
+        self.assertEqual(Polynomial([]).eval(2., 'estrin'), 0)
+        self.assertEqual(Polynomial([4]).eval(2., 'parallel'), 4)
+        # Powers of x0 overflow, although the value does not.
+        p = Polynomial([1e-300] * 601)
+        for workers in [1, 2, 3]:
+            with self.subTest(workers=workers):
+                np.testing.assert_allclose(
+                    p.eval(10., 'parallel', workers=workers), p.eval(10.))
+        np.testing.assert_allclose(p.eval(10., 'estrin'), p.eval(10.))
+        # Integer points, whose powers exceed int64.
+        p = Polynomial([1] * 100)
+        for method in ['estrin', 'parallel']:
+            with self.subTest(method=method):
+                np.testing.assert_allclose(
+                    p.eval(2, method, workers=3), p.eval(2))
+                self.assertIsInstance(p.eval(2, method), float)
+        with mock.patch('os.cpu_count', return_value=None):
+            self.assertEqual(Polynomial([1, 2]).eval(3., 'parallel'), 7)
+        with self.assertRaises(ValueError):
+            Polynomial([1, 2]).eval(2., 'clenshaw')
+
+    def test_call(self):
+        p = Polynomial([5, 9, -1, 8, 4])
+        self.assertEqual(p(17), p.eval(17))
+        self.assertEqual(p(2 + 1j), p.eval(2 + 1j))
+        xs = np.linspace(-3, 3, 1001).reshape(7, 143)
+        expected = np.vectorize(p.eval)(xs)
+        np.testing.assert_allclose(p(xs), expected)
+        np.testing.assert_allclose(p(xs, chunk_size=100), expected)
+        np.testing.assert_allclose(
+            Polynomial([1, 2], 'numpy')([0, 1, 2]), [1, 3, 5])
+        np.testing.assert_array_equal(Polynomial([])(np.arange(3)), 0)
+        with self.assertRaises(ValueError):
+            p(xs, chunk_size=0)
+
     def test_roots(self):
         np.testing.assert_almost_equal(
             Polynomial([-3, 1]).roots(),
@@ -176,7 +282,93 @@ class TestPolynomials(unittest.TestCase):
         )
         with self.assertRaises(ValueError):
             Polynomial([]).roots()
+
+    def test_roots_aberth(self):
+        np.testing.assert_almost_equal(
+            sorted(Polynomial([3, 0, 1]).roots(method='aberth'),
+                   key=lambda z: z.imag),
+            [-1.7320508j, 1.7320508j]
+        )
+        np.testing.assert_almost_equal(
+            sorted(Polynomial([0, 0, 2, -2]).roots(method='aberth'),
+                   key=abs),
+            [0, 0, 1]
+        )
+        self.assertEqual(Polynomial([18]).roots(method='aberth'), [])
+        expected = np.arange(1, 11)
+        wilkinson = Polynomial(np.poly(expected)[::-1])
+        for polish in [False, True]:
+            roots = wilkinson.roots(method='aberth', polish=polish)
+            np.testing.assert_allclose(
+                sorted(np.real(roots)), expected, rtol=1e-6)
+            np.testing.assert_allclose(np.imag(roots), 0, atol=1e-6)
+        coeffs = np.random.default_rng(0).standard_normal(201)
+        roots = Polynomial(coeffs, 'numpy').roots(method='aberth')
+        self.assertEqual(len(roots), 200)
+        distances = np.abs(
+            np.array(roots)[:, None] - np.roots(coeffs[::-1])[None, :])
+        self.assertLess(distances.min(axis=1).max(), 1e-8)
+        self.assertLess(distances.min(axis=0).max(), 1e-8)
+        with self.assertRaises(ValueError):
+            Polynomial([1, 1]).roots(method='bisection')
+
+    def test_roots_companion(self):
+        np.testing.assert_almost_equal(
+            sorted(Polynomial([-6, 11, -6, 1]).roots(method='companion'),
+                   key=abs),
+            [1, 2, 3]
+        )
+        np.testing.assert_almost_equal(
+            sorted(Polynomial([0, 0, 2, -2]).roots(
+                method='companion', polish=True), key=abs),
+            [0, 0, 1]
+        )
+        self.assertEqual(Polynomial([18]).roots(method='companion'), [])
+
+    def test_roots_many(self):
+        coeffs = np.random.default_rng(1).standard_normal((100, 8))
+        roots = roots_many(coeffs)
+        self.assertEqual(roots.shape, (100, 7))
+        for c, r in zip(coeffs, roots):
+            distances = np.abs(r[:, None] - np.roots(c[::-1])[None, :])
+            self.assertLess(distances.min(axis=1).max(), 1e-8)
+        self.assertEqual(roots_many(np.ones((3, 1))).shape, (3, 0))
+        with self.assertRaises(ValueError):
+            roots_many([[1, 2], [1, 0]])
+        with self.assertRaises(ValueError):
+            roots_many([1, 2])
     
+    def test_numpy_backend(self):
+        a = [0, 3, 9, -1]
+        b = [2, 4, -9, -5, 4]
+        pa, pb = Polynomial(a, 'numpy'), Polynomial(b, 'numpy')
+        self.assertEqual(pa + pb, Polynomial(a) + Polynomial(b))
+        self.assertEqual(pa - pb, Polynomial(a) - Polynomial(b))
+        self.assertEqual(pa * pb, Polynomial(a) * Polynomial(b))
+        self.assertEqual(pa * 2.5, Polynomial(a) * 2.5)
+        self.assertEqual(-pa, Polynomial(a) * -1)
+        self.assertEqual(pb.derivative(), Polynomial(b).derivative())
+        self.assertEqual((pa + pb).backend, 'numpy')
+        self.assertEqual((pa + Polynomial(b)).backend, 'numpy')
+        self.assertEqual(
+            Polynomial([-42, 0, -12, 1], 'numpy') / Polynomial([-3, 1, 1]),
+            (Polynomial([-13, 1]), Polynomial([-81, 16]))
+        )
+        np.testing.assert_almost_equal(
+            sorted(Polynomial([-1, 0, 1], 'numpy').roots()), [-1, 1])
+
+    def test_numpy_backend_trims_and_compares(self):
+        self.assertEqual(Polynomial([1, 2, 0, 0], 'numpy').degree, 1)
+        self.assertEqual(Polynomial([0, 0], 'numpy'), 0)
+        self.assertEqual(Polynomial([1, 2], 'numpy') * 0, 0)
+        self.assertEqual(Polynomial([1, 2], 'numpy') * Polynomial([]), 0)
+        self.assertEqual(
+            Polynomial([1, 2], 'numpy'), Polynomial([1, 2 + _EQ_EPS / 2]))
+        self.assertNotEqual(
+            Polynomial([1, 2], 'numpy'), Polynomial([1, 2 + 2 * _EQ_EPS]))
+        with self.assertRaises(ValueError):
+            Polynomial([1], 'tuple')
+
     def test_interpolation_validates_input(self):
         for method in ["newton", "lagrange"]:
             with self.subTest(method):
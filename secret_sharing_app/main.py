@@ -1,6 +1,6 @@
 from flask import Flask, render_template, request
-from polynomials_modulo import lagrange_interpolation, PolynomialModulo
-from random import randint
+from polynomials_modulo import PolynomialModulo
+import shamir_secret_sharing
 
 app = Flask(__name__)
 
@@ -14,11 +14,7 @@ def create_polynomial(
         secret: int, degree: int) -> PolynomialModulo:
     """Creates a random polynomial of degree n with the constant term equal to
     `secret`."""
-    coeffs = [secret] + [
-        randint(0, M - 1)
-        for _ in range(1, degree)
-    ]
-    return PolynomialModulo(coeffs, M)
+    return shamir_secret_sharing.create_polynomial(secret, degree, M)
 
 @app.route("/generate", methods=['POST'])
 def generate():
@@ -28,10 +24,8 @@ def generate():
 
     poly = create_polynomial(secret, degree)
 
-    parts = [
-        (i, poly.eval(i))
-        for i in range(1, num_parts + 1)
-    ]
+    xs = list(range(1, num_parts + 1))
+    parts = list(zip(xs, poly.eval_many(xs)))
 
     return render_template('generate.html', parts=parts, degree=degree)
 
@@ -49,6 +43,6 @@ def final():
         x_i = int(request.form['x_%d' % i])
         y_i = int(request.form['y_%d' % i])
         points.append((x_i, y_i))
-    poly = lagrange_interpolation(points, M)
-    return render_template('final.html', secret=poly.eval(0))
+    secret = shamir_secret_sharing.reconstruct_secret(points, M)
+    return render_template('final.html', secret=secret)
     
\ No newline at end of file
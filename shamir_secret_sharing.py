@@ -0,0 +1,115 @@
+"""
+Shamir's secret sharing, as a library.
+
+A secret is the constant term of a random polynomial P of degree k - 1 modulo
+m. Shares are pairs (x, P(x)) for x = 1, 2, ..., and any k of them suffice to
+restore the secret with Lagrange interpolation.
+
+Shares are generated lazily in chunks and can be written to a binary file of
+little-endian uint64 (x, y) records, which is read back as a memory-mapped
+array. This way millions of shares are never held in memory at once, nor
+turned into Python tuples.
+"""
+from collections.abc import Iterator
+from random import randint
+
+import numpy as np
+
+from polynomials_modulo import (
+    PolynomialModulo, lagrange_interpolation, lagrange_weights_at_zero)
+
+# A single share in a binary file.
+SHARE_DTYPE = np.dtype([('x', '<u8'), ('y', '<u8')])
+
+_CHUNK_SIZE = 1 << 16
+
+
+def create_polynomial(
+        secret: int, degree: int, m: int) -> PolynomialModulo:
+    """Creates a random polynomial of degree n with the constant term equal to
+    `secret`."""
+    coeffs = [secret] + [
+        randint(0, m - 1)
+        for _ in range(1, degree)
+    ]
+    return PolynomialModulo(coeffs, m)
+
+
+def generate_shares(
+        secret: int, degree: int, num_shares: int, m: int,
+        chunk_size: int = _CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """Splits `secret` into `num_shares` shares, `degree` of which are needed
+    to restore it.
+
+    Yields arrays of at most `chunk_size` shares of dtype `SHARE_DTYPE`."""
+    if m >= 2 ** 64:
+        raise ValueError("modulus must be smaller than 2^64")
+    if num_shares >= m:
+        raise ValueError("there must be fewer shares than the modulus")
+    poly = create_polynomial(secret, degree, m)
+    for start in range(1, num_shares + 1, chunk_size):
+        xs = np.arange(
+            start, min(start + chunk_size, num_shares + 1), dtype=np.int64)
+        chunk = np.empty(len(xs), dtype=SHARE_DTYPE)
+        chunk['x'] = xs
+        chunk['y'] = poly.eval_many(xs)
+        yield chunk
+
+
+def write_shares(path: str, chunks: Iterator[np.ndarray]) -> int:
+    """Writes chunks of shares to a binary file at `path`.
+
+    Returns the number of written shares."""
+    written = 0
+    with open(path, 'wb') as f:
+        for chunk in chunks:
+            np.asarray(chunk, dtype=SHARE_DTYPE).tofile(f)
+            written += len(chunk)
+    return written
+
+
+def read_shares(path: str) -> np.memmap:
+    """Memory-maps a binary file of shares written by `write_shares`."""
+    return np.memmap(path, dtype=SHARE_DTYPE, mode='r')
+
+
+def reconstruct_polynomial(
+        shares: np.ndarray, m: int) -> PolynomialModulo:
+    """Restores the polynomial going through all `shares` (of dtype
+    `SHARE_DTYPE`)."""
+    points = np.stack((shares['x'], shares['y']), axis=1)
+    method = 'subproduct_tree' if len(points) > 64 else 'direct'
+    return lagrange_interpolation(points, m, method)
+
+
+def reconstruct_secret(
+        points: list[tuple[int, int]] | np.ndarray, m: int) -> int:
+    """Restores the secret, i.e. the value at 0 of the polynomial going
+    through all `points`, without interpolating the polynomial.
+
+    Lagrange weights at 0 are cached per set of xs, so repeated
+    reconstructions by the same share holders cost O(k) multiplications.
+
+    Points must be in format [x, y]: either a list of pairs or an array of
+    shape (k, 2)."""
+    if isinstance(points, np.ndarray):
+        points = points[np.argsort(points[:, 0], kind='stable')]
+        xs, ys = points[:, 0].tolist(), points[:, 1].tolist()
+    else:
+        points = sorted(points)
+        xs, ys = zip(*points)
+    if len(set(xs)) != len(xs):
+        raise ValueError("xs must be unique")
+    weights = lagrange_weights_at_zero(tuple(x % m for x in xs), m)
+    return sum(w * y for w, y in zip(weights, ys)) % m
+
+
+def reconstruct_from_file(
+        path: str, degree: int, m: int, offset: int = 0) -> int:
+    """Restores the secret from `degree` shares stored in the file at `path`,
+    starting with the `offset`-th one."""
+    shares = read_shares(path)[offset:offset + degree]
+    if len(shares) < degree:
+        raise ValueError("not enough shares to restore the secret")
+    return reconstruct_secret(
+        np.stack((shares['x'], shares['y']), axis=1), m)
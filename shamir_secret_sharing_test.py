@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from shamir_secret_sharing import (
+    SHARE_DTYPE, create_polynomial, generate_shares, read_shares,
+    reconstruct_from_file, reconstruct_polynomial, reconstruct_secret,
+    write_shares)
+from polynomials_modulo import lagrange_weights_at_zero
+
+M = 1000000007
+
+class ShamirSecretSharingTest(unittest.TestCase):
+
+    def test_create_polynomial(self):
+        poly = create_polynomial(1234, 5, M)
+        self.assertEqual(poly.eval(0), 1234)
+        self.assertLessEqual(poly.degree, 4)
+
+    def test_generate_shares(self):
+        chunks = list(generate_shares(1234, 5, 1000, M, chunk_size=300))
+        self.assertEqual([len(c) for c in chunks], [300, 300, 300, 100])
+        shares = np.concatenate(chunks)
+        self.assertEqual(shares.dtype, SHARE_DTYPE)
+        np.testing.assert_array_equal(shares['x'], np.arange(1, 1001))
+        self.assertEqual(reconstruct_polynomial(shares[:5], M).eval(0), 1234)
+        self.assertEqual(
+            reconstruct_polynomial(shares[500:], M),
+            reconstruct_polynomial(shares[-5:], M))
+
+    def test_generate_shares_big_modulus(self):
+        for m in [2 ** 61 - 1, 2 ** 64 - 59]:
+            with self.subTest(m):
+                secret = m - 12345
+                shares = np.concatenate(list(
+                    generate_shares(secret, 5, 1000, m, chunk_size=300)))
+                poly = reconstruct_polynomial(shares[:5], m)
+                self.assertEqual(poly.eval(0), secret)
+                self.assertEqual(
+                    [poly.eval(int(x)) for x in shares['x']],
+                    shares['y'].tolist())
+                self.assertEqual(
+                    reconstruct_secret(
+                        np.stack((shares['x'], shares['y']), axis=1)[-5:], m),
+                    secret)
+
+    def test_generate_shares_validates_input(self):
+        with self.assertRaises(ValueError):
+            next(generate_shares(1, 2, 10, 2 ** 64 + 13))
+        with self.assertRaises(ValueError):
+            next(generate_shares(1, 2, 13, 13))
+
+    def test_reconstruct_secret(self):
+        poly = create_polynomial(4321, 4, M)
+        points = [(x, poly.eval(x)) for x in [9, 2, 30, 4]]
+        self.assertEqual(reconstruct_secret(points, M), 4321)
+        self.assertEqual(reconstruct_secret(np.array(points), M), 4321)
+        self.assertEqual(
+            reconstruct_secret([(1, 200), (2, 500), (3, 1000)], 251), 100)
+        with self.assertRaises(ValueError):
+            reconstruct_secret([(1, 200), (1, 500)], 251)
+
+    def test_reconstruct_secret_many_shares(self):
+        poly = create_polynomial(777, 300, M)
+        points = [(x, poly.eval(x)) for x in range(5, 1505, 5)]
+        self.assertEqual(reconstruct_secret(points, M), 777)
+
+    def test_reconstruct_secret_caches_weights(self):
+        lagrange_weights_at_zero.cache_clear()
+        for secret in range(10):
+            poly = create_polynomial(secret, 3, M)
+            points = [(x, poly.eval(x)) for x in [3, 1, 2]]
+            self.assertEqual(reconstruct_secret(points, M), secret)
+        info = lagrange_weights_at_zero.cache_info()
+        self.assertEqual((info.hits, info.misses), (9, 1))
+
+    def test_file_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'shares.bin')
+            written = write_shares(
+                path, generate_shares(98765, 7, 10000, M, chunk_size=999))
+            self.assertEqual(written, 10000)
+            self.assertEqual(os.path.getsize(path), 10000 * 16)
+            self.assertEqual(len(read_shares(path)), 10000)
+            self.assertEqual(reconstruct_from_file(path, 7, M), 98765)
+            self.assertEqual(
+                reconstruct_from_file(path, 7, M, offset=9993), 98765)
+            with self.assertRaises(ValueError):
+                reconstruct_from_file(path, 7, M, offset=9995)
+
+if __name__ == '__main__':
+    unittest.main()
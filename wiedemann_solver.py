@@ -0,0 +1,98 @@
+"""
+Wiedemann's algorithm for sparse linear systems modulo a prime.
+
+https://en.wikipedia.org/wiki/Block_Wiedemann_algorithm
+
+The matrix is a black box: the solver only calls a function computing the
+product A v, so it never creates fill-in. For a random vector u the sequence
+u^T A^i b satisfies the same linear recurrence as A^i b (with high
+probability), which is found with the Berlekamp-Massey algorithm. If
+f_0 + f_1 x + ... + f_L x^L is its polynomial, then
+
+    x = -(f_1 b + f_2 A b + ... + f_L A^(L-1) b) / f_0
+
+solves A x = b. It takes at most 3n products with A, i.e. O(n * nnz) time,
+and O(n) memory on top of the matrix.
+"""
+from collections.abc import Callable
+
+import numpy as np
+
+from modulo_division import inv_mod
+from polynomials_modulo import berlekamp_massey
+
+_MAX_MODULUS = 2 ** 31
+
+
+def sparse_matvec(
+        rows: list[dict[int, int]], m: int
+) -> Callable[[np.ndarray], np.ndarray]:
+    """Returns a function multiplying the square sparse matrix `rows` by
+    vectors modulo `m`.
+
+    Row i maps column indices to its nonzero coefficients, as in
+    `gauss_elimination.solve_sparse_mod`. The matrix is stored in the CSR
+    format, in int64 arrays, so `m` must be smaller than 2^31."""
+    if m >= _MAX_MODULUS:
+        raise ValueError("modulus must be smaller than 2^31")
+    n = len(rows)
+    lengths = np.array([len(row) for row in rows], dtype=np.int64)
+    indices = np.fromiter(
+        (j for row in rows for j in row), dtype=np.int64,
+        count=int(lengths.sum()))
+    data = np.fromiter(
+        (v % m for row in rows for v in row.values()), dtype=np.int64,
+        count=len(indices))
+    if len(indices) and not (0 <= indices.min() and indices.max() < n):
+        raise ValueError("the matrix must be square")
+    starts = np.cumsum(lengths) - lengths
+    nonempty = lengths > 0
+
+    def matvec(v: np.ndarray) -> np.ndarray:
+        result = np.zeros(n, dtype=np.int64)
+        if len(indices):
+            products = data * v[indices] % m
+            # Each sum of fewer than 2^32 residues fits in int64.
+            result[nonempty] = np.add.reduceat(
+                products, starts[nonempty]) % m
+        return result
+
+    return matvec
+
+
+def wiedemann_solve(
+        matvec: Callable[[np.ndarray], np.ndarray], b: list[int], m: int,
+        retries: int = 3, seed: int | None = None) -> np.ndarray:
+    """Solves A x = b modulo prime `m` < 2^31, for a nonsingular n x n
+    matrix A given by `matvec`, which computes A v for an int64 vector v.
+
+    The randomized projection can miss part of the recurrence; every
+    solution is therefore checked and the computation is repeated with a
+    new projection at most `retries` times.
+
+    Raises ValueError if no solution was found, which (with high
+    probability) means that A is singular."""
+    if m >= _MAX_MODULUS:
+        raise ValueError("modulus must be smaller than 2^31")
+    b = np.asarray(b, dtype=np.int64) % m
+    n = len(b)
+    if not b.any():
+        return np.zeros(n, dtype=np.int64)
+    rng = np.random.default_rng(seed)
+    for _ in range(retries + 1):
+        u = rng.integers(0, m, size=n)
+        seq, v = [], b
+        for _ in range(2 * n):
+            seq.append(int((u * v % m).sum() % m))
+            v = matvec(v)
+        f = berlekamp_massey(seq, m).coeffs
+        if f[0] == 0:
+            continue
+        # Horner: x = f_1 b + A (f_2 b + A (... + A f_L b)).
+        x = np.zeros(n, dtype=np.int64)
+        for c in f[:0:-1]:
+            x = (matvec(x) + c * b) % m
+        x = x * (m - inv_mod(f[0], m)) % m
+        if np.array_equal(matvec(x), b):
+            return x
+    raise ValueError(f"matrix is singular modulo {m}")
@@ -0,0 +1,47 @@
+import unittest
+import numpy as np
+from gauss_elimination import solve_sparse_mod
+from wiedemann_solver import sparse_matvec, wiedemann_solve
+
+
+def _random_sparse(n: int, m: int, seed: int) -> list[dict[int, int]]:
+    rng = np.random.default_rng(seed)
+    rows = [{i: int(rng.integers(1, m))} for i in range(n)]
+    for row in rows:
+        for j in rng.integers(0, n, size=3).tolist():
+            row[j] = int(rng.integers(0, m))
+    return rows
+
+
+class WiedemannSolverTest(unittest.TestCase):
+
+    def test_sparse_matvec(self):
+        rows = [{0: 1, 2: 5}, {}, {1: -1, 2: 2}]
+        matvec = sparse_matvec(rows, 7)
+        np.testing.assert_array_equal(
+            matvec(np.array([1, 2, 3])), [2, 0, 4])
+        with self.assertRaises(ValueError):
+            sparse_matvec([{0: 1}, {2: 1}], 7)
+        with self.assertRaises(ValueError):
+            sparse_matvec(rows, 2 ** 31)
+
+    def test_wiedemann_solve(self):
+        for n, m in [(1, 7), (10, 101), (200, 998244353)]:
+            with self.subTest(n=n, m=m):
+                rows = _random_sparse(n, m, n)
+                b = np.random.default_rng(0).integers(0, m, size=n)
+                x = wiedemann_solve(sparse_matvec(rows, m), b, m, seed=1)
+                self.assertEqual(
+                    x.tolist(), solve_sparse_mod(rows, b.tolist(), m))
+
+    def test_wiedemann_solve_zero_rhs(self):
+        x = wiedemann_solve(sparse_matvec([{0: 1}, {1: 1}], 7), [0, 7], 7)
+        np.testing.assert_array_equal(x, [0, 0])
+
+    def test_wiedemann_solve_singular(self):
+        with self.assertRaises(ValueError):
+            wiedemann_solve(
+                sparse_matvec([{0: 1, 1: 2}, {0: 2, 1: 4}], 7), [1, 3], 7)
+
+if __name__ == '__main__':
+    unittest.main()